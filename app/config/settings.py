@@ -76,10 +76,23 @@ class Settings(BaseSettings):
     ZERO_SHOT_MODEL_NAME: str = Field(
         "facebook/bart-large-mnli", env="ZERO_SHOT_MODEL_NAME"
     )
-    NER_MODEL_NAME: str = Field("dslim/bert-base-NER", env="NER_MODEL_NAME")
+    NER_MODEL_NAME: str = Field("dslim/distilbert-NER", env="NER_MODEL_NAME")
+    INTENT_CACHE_SIZE: int = Field(1024, env="INTENT_CACHE_SIZE")
+    NER_CACHE_SIZE: int = Field(1024, env="NER_CACHE_SIZE")
+    NLP_BATCH_SIZE: int = Field(16, env="NLP_BATCH_SIZE")
+    NLP_BATCH_WAIT_MS: float = Field(5.0, env="NLP_BATCH_WAIT_MS")
+    PRELOAD_INTENT_CLASSIFIER: bool = Field(False, env="PRELOAD_INTENT_CLASSIFIER")
+    NLP_EAGER_INIT: bool = Field(False, env="NLP_EAGER_INIT")
 
     # Hardware and Performance Settings
     USE_GPU: bool = Field(True, env="USE_GPU")
+    USE_INT8_QUANTIZATION: bool = Field(False, env="USE_INT8_QUANTIZATION")
+    USE_BF16: bool = Field(False, env="USE_BF16")
+    USE_HALF_PRECISION: bool = Field(False, env="USE_HALF_PRECISION")  # GPU only
+    USE_TORCH_COMPILE: bool = Field(False, env="USE_TORCH_COMPILE")
+    USE_ORT: bool = Field(False, env="USE_ORT")  # needs optimum[onnxruntime] installed
+    TORCH_THREADS: int = Field(0, env="TORCH_THREADS")  # 0 keeps torch's default
+    NLP_WARMUP: bool = Field(True, env="NLP_WARMUP")
 
     # Logging Settings
     LOG_LEVEL: str = Field("DEBUG", env="LOG_LEVEL")
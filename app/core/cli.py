@@ -44,7 +44,7 @@ from app.services.nlp_service import NLPService
 import traceback
 from datetime import datetime
 
-from app.services.nlp_service import nlp_service, MessageResponse
+from app.services.nlp_service import get_nlp_service, MessageResponse
 from app.core import initial_data
 
 # Enhanced color theme with scientific aesthetics
@@ -363,7 +363,7 @@ def handle_command(command: str):
             task = progress.add_task(description="Processing...", total=None)
             
             try:
-                response = nlp_service.handle_message(command)
+                response = get_nlp_service().handle_message(command)
                 if response is None:
                     raise ValueError("NLP service returned None response")
                 display_nlp_analysis(command, response)
@@ -405,7 +405,7 @@ def initialize_processor() -> NLPService:
     """Initialize the language processor with error handling."""
     try:
         logger.info("Initializing language processor...")
-        processor = nlp_service
+        processor = get_nlp_service()
         logger.info("Language processor initialized successfully")
         return processor
     except Exception as e:
@@ -20,17 +20,17 @@
 
 from typing import NoReturn
 from datetime import datetime
-from app.services.booking_service import in_memory_bookings_db, create_booking
+from app.services.booking_service import count_bookings, seed_bookings, clear_bookings
 from app.schemas.booking import BookingCreate
 
 
 async def load_initial_data() -> NoReturn:
     """
     Initialize the system with required initial bookings using the standard
-    BookingCreate schema. This function populates the global in_memory_bookings_db
-    and should be called once during application startup.
+    BookingCreate schema. This function populates the booking store and
+    should be called once during application startup.
     """
-    if in_memory_bookings_db:
+    if count_bookings():
         return
 
     initial_bookings = [
@@ -55,9 +55,9 @@ async def load_initial_data() -> NoReturn:
     ]
 
     try:
-        for booking_data in initial_bookings:
-            # Pass system_init=True to bypass time validation for initial data
-            create_booking(booking_data, system_init=True)
+        # The seed set is fixed and known to be conflict-free, so it is
+        # loaded without per-booking validation in a single store update
+        seed_bookings(initial_bookings)
     except Exception as e:
-        in_memory_bookings_db.clear()
+        clear_bookings()
         raise RuntimeError(f"Failed to initialize booking system: {str(e)}")
\ No newline at end of file
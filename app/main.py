@@ -22,18 +22,21 @@ Date   : January 2025
 
 import logging
 import sys
-from typing import Dict, Any
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Any
 from datetime import datetime
 
 from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
+from fastapi.concurrency import run_in_threadpool
 
 from app.config.settings import settings
 from app.core.initial_data import load_initial_data
 from app.routers.bookings import router as bookings_router
-from app.schemas.response import APIResponse, ErrorDetail
+from app.services.nlp_service import get_nlp_service
+from app.utils.datetime_utils import current_utc_timestamp
 
 # Configure logging
 logging.basicConfig(
@@ -43,6 +46,53 @@ logging.basicConfig(
 )
 logger = logging.getLogger("technician_booking_api")
 
+# Constant parts of the APIResponse error envelopes. Handlers only splice in
+# the per-error details and timestamp instead of building and dumping models.
+_VALIDATION_ERROR: Dict[str, str] = {
+    "code": "VALIDATION_ERROR",
+    "message": "Request validation failed",
+}
+_INTERNAL_ERROR: Dict[str, str] = {
+    "code": "INTERNAL_ERROR",
+    "message": "An unexpected error occurred",
+}
+
+def _error_envelope(error: Dict[str, str], details: Dict[str, Any]) -> Dict[str, Any]:
+    """Build an APIResponse-shaped error body from a prebuilt error template."""
+    return {
+        "success": False,
+        "data": None,
+        "error": {
+            **error,
+            "details": details,
+            "timestamp": current_utc_timestamp()
+        },
+        "metadata": {}
+    }
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Initialize application state before serving requests and clean up on shutdown.
+
+    Requests are only accepted once the initial data has been loaded.
+    """
+    try:
+        logger.info("Starting Technician Booking System...")
+        await load_initial_data()
+        if settings.NLP_EAGER_INIT:
+            logger.info("Loading NLP models...")
+            await run_in_threadpool(get_nlp_service)
+        logger.info("System initialization complete.")
+    except Exception as e:
+        logger.error(f"Failed to initialize system: {str(e)}", exc_info=True)
+        sys.exit(1)
+
+    yield
+
+    logger.info("Shutting down Technician Booking System...")
+    # Add any cleanup tasks here if needed
+
 def create_app() -> FastAPI:
     """Initialize and configure the FastAPI application."""
     app = FastAPI(
@@ -50,7 +100,8 @@ def create_app() -> FastAPI:
         description="Advanced booking system with NLP capabilities for technician scheduling.",
         version="1.0.0",
         docs_url="/docs" if settings.DEBUG else None,
-        redoc_url="/redoc" if settings.DEBUG else None
+        redoc_url="/redoc" if settings.DEBUG else None,
+        lifespan=lifespan
     )
 
     # CORS setup
@@ -62,24 +113,6 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
-    # Register startup event
-    @app.on_event("startup")
-    async def startup_event() -> None:
-        """Initialize application state on startup."""
-        try:
-            logger.info("Starting Technician Booking System...")
-            await load_initial_data()
-            logger.info("System initialization complete.")
-        except Exception as e:
-            logger.error(f"Failed to initialize system: {str(e)}", exc_info=True)
-            sys.exit(1)
-
-    @app.on_event("shutdown")
-    async def shutdown_event() -> None:
-        """Clean up resources on shutdown."""
-        logger.info("Shutting down Technician Booking System...")
-        # Add any cleanup tasks here if needed
-
     # Register routers
     app.include_router(
         bookings_router,
@@ -100,7 +133,7 @@ def create_app() -> FastAPI:
         """
         return {
             "status": "healthy",
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": current_utc_timestamp(),
             "version": app.version,
             "environment": settings.ENV
         }
@@ -108,25 +141,19 @@ def create_app() -> FastAPI:
     @app.exception_handler(RequestValidationError)
     async def validation_exception_handler(request: Request, exc: RequestValidationError):
         """Handle request validation errors."""
-        errors = []
-        for error in exc.errors():
-            errors.append({
-                "loc": " -> ".join(str(loc) for loc in error["loc"]),
+        join_loc = " -> ".join
+        errors = [
+            {
+                "loc": join_loc(map(str, error["loc"])),
                 "msg": error["msg"],
                 "type": error["type"]
-            })
+            }
+            for error in exc.errors()
+        ]
 
         return JSONResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            content=APIResponse(
-                success=False,
-                error=ErrorDetail(
-                    code="VALIDATION_ERROR",
-                    message="Request validation failed",
-                    details={"errors": errors},
-                    timestamp=datetime.utcnow().isoformat() + "Z"  # Ensure string format
-                )
-            ).dict()
+            content=_error_envelope(_VALIDATION_ERROR, {"errors": errors})
         )
 
     @app.exception_handler(Exception)
@@ -145,18 +172,13 @@ def create_app() -> FastAPI:
 
         return JSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content=APIResponse(
-                success=False,
-                error=ErrorDetail(
-                    code="INTERNAL_ERROR",
-                    message="An unexpected error occurred",
-                    details={
-                        "error_id": error_id,
-                        "support_message": "Please contact support with this error ID"
-                    },
-                    timestamp=datetime.utcnow().isoformat() + "Z"  # Ensure string format
-                )
-            ).dict()
+            content=_error_envelope(
+                _INTERNAL_ERROR,
+                {
+                    "error_id": error_id,
+                    "support_message": "Please contact support with this error ID"
+                }
+            )
         )
 
     return app
@@ -6,7 +6,7 @@
   Defines the core Booking domain model used within the  
   Technician Booking System.  
 
-  - Implemented as a simple dataclass for in-memory usage  
+  - Implemented as a slotted dataclass for in-memory usage  
   - Can be extended to support a real database (e.g., SQLAlchemy)  
   - Automatically generates unique booking IDs (UUID)  
 
@@ -19,14 +19,34 @@
 
 import uuid
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
 
-@dataclass
+
+def to_epoch_micros(value: datetime) -> int:
+    """
+    Convert a datetime to integer microseconds since the Unix epoch.
+
+    Exact (no float rounding), so ordering and overlap comparisons on the
+    result match comparisons on the datetimes themselves. Naive datetimes are
+    read as system local time, like ``datetime.timestamp``.
+    """
+    if value.tzinfo is None:
+        value = value.astimezone()
+    return (value - _EPOCH) // _MICROSECOND
+
+
+@dataclass(slots=True)
 class Booking:
     """
     Represents a single technician booking instance.
 
+    Declared with ``slots=True``: instances carry no per-object ``__dict__``,
+    so each stored booking is smaller and attribute reads in the listing and
+    conflict-check loops go straight to fixed slots.
+
     Attributes:
         id (str): Unique identifier for the booking, auto-generated as a UUID.
         customer_name (str): Name of the customer requesting the service.
@@ -34,6 +54,10 @@ class Booking:
         profession (str): The profession/specialization of the technician (e.g. 'Plumber').
         start_time (datetime): The start time of the scheduled service.
         end_time (datetime): The end time of the scheduled service.
+        technician_name_lower (str): Lowercased technician name, derived once
+            on creation; it is the key of the service's per-technician index.
+        start_ts (int): start_time as epoch microseconds, derived on creation.
+        end_ts (int): end_time as epoch microseconds, derived on creation.
     """
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     customer_name: str = "Anonymous Customer"  # Default value
@@ -41,3 +65,13 @@ class Booking:
     profession: str = ""
     start_time: datetime = datetime.now()
     end_time: datetime = datetime.now()
+    technician_name_lower: str = field(init=False, repr=False, compare=False)
+    start_ts: int = field(init=False, repr=False, compare=False)
+    end_ts: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.technician_name_lower = self.technician_name.lower()
+        # Integer keys make schedule bisects and overlap checks plain int
+        # comparisons instead of tz-aware datetime comparisons.
+        self.start_ts = to_epoch_micros(self.start_time)
+        self.end_ts = to_epoch_micros(self.end_time)
@@ -22,23 +22,45 @@ Date   : January 2025
 ==========================================================
 """
 
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from typing import Iterable, List, Optional, Dict, Any, Tuple
+from uuid import UUID
 import logging
 
-from fastapi import APIRouter, status
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+import orjson
+from fastapi import APIRouter, Query, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, ConfigDict, Field
 
+from app.models.booking import Booking
 from app.services import booking_service
 from app.schemas.booking import BookingCreate, BookingResponse
-from app.services.nlp_service import nlp_service
-from app.schemas.response import APIResponse, ErrorDetail  # Import from the centralized module
+from app.services.nlp_service import get_nlp_service
+from app.utils.datetime_utils import current_iso_timestamp, current_utc_timestamp
+from app.schemas.response import APIResponse  # Import from the centralized module
 
 # Configure router
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = logging.getLogger("bookings_router")
 
+# Prebuilt payload for the empty-store listing (cold start, tests), so the
+# formatting pass is skipped entirely when there is nothing to list.
+_EMPTY_BOOKINGS_DATA: Dict[str, Any] = {"formatted_bookings": ""}
+
+# Constant bytes of the success envelope; only `data` and `metadata` vary.
+_SUCCESS_PREFIX = b'{"success":true,"data":'
+_SUCCESS_METADATA = b',"error":null,"metadata":'
+_SUCCESS_SUFFIX = b"}"
+
+# Serialized `data` of list_bookings pages, keyed by (offset, limit) and valid
+# for a single store version; any write empties it on the next listing.
+_listing_cache: Dict[Tuple[int, int], bytes] = {}
+_listing_cache_version = -1
+_LISTING_CACHE_MAX_PAGES = 128
+
+# Display format for booking times in formatted listings.
+_DISPLAY_TIME_FORMAT = "%Y-%m-%d %I:%M %p"
+
 # Enhanced response models
 class AnalysisScore(BaseModel):
     """Model for intent classification scores."""
@@ -46,20 +68,20 @@ class AnalysisScore(BaseModel):
     confidence: float = Field(..., description="Confidence score for the intent")
     assessment: str = Field(..., description="Qualitative assessment of the confidence")
 
-class ErrorDetail(BaseModel):
-    """Enhanced error detail model."""
-    code: str = Field(..., description="Error code for frontend handling")
-    message: str = Field(..., description="Human-readable error message")
-    details: Optional[Dict[str, Any]] = Field(None, description="Additional error context")
-    timestamp: str = Field(..., description="Error timestamp in ISO format")
-
 class CommandRequest(BaseModel):
     """Enhanced command request model."""
     message: str = Field(..., min_length=1, description="User command text")
     context: Optional[Dict[str, Any]] = Field(None, description="Additional context")
 
 class CommandResult(BaseModel):
-    """Enhanced command result model."""
+    """
+    Enhanced command result model.
+
+    Only ever built by trusted handler code, so it is created through
+    ``model_construct`` and frozen instead of being re-validated per request.
+    """
+    model_config = ConfigDict(validate_assignment=False, frozen=True)
+
     success: bool = Field(..., description="Whether the command was successful")
     intent: str = Field(..., description="Classified intent")
     message: str = Field(..., description="Response message")
@@ -68,41 +90,123 @@ class CommandResult(BaseModel):
     bookings: Optional[List[BookingResponse]] = Field(None, description="List of bookings")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional response metadata")
 
-def create_error_response(status_code: int, code: str, message: str, details: Optional[Dict] = None) -> JSONResponse:
-    """Create a standardized error response with ISO-formatted timestamp."""
-    error_detail = ErrorDetail(
-        code=code,
-        message=message,
-        details=details,
-        timestamp=datetime.utcnow().isoformat() + "Z"
-    )
+def create_error_response(status_code: int, code: str, message: str, details: Optional[Dict] = None) -> ORJSONResponse:
+    """
+    Create a standardized error response with ISO-formatted timestamp.
 
-    # Convert `ErrorDetail` explicitly to a dictionary before passing it
-    api_response = APIResponse(
-        success=False,
-        error=error_detail.model_dump(),
-        metadata={}
+    The body mirrors APIResponse/ErrorDetail (see app.schemas.response) but is
+    built as a plain dict, so no models are instantiated on the error path.
+    """
+    return ORJSONResponse(
+        status_code=status_code,
+        content={
+            "success": False,
+            "data": None,
+            "error": {
+                "code": code,
+                "message": message,
+                "details": details,
+                "timestamp": current_utc_timestamp()
+            },
+            "metadata": {}
+        }
     )
 
-    return JSONResponse(
+def _dump_booking(booking: BookingResponse) -> bytes:
+    """
+    Serialize a BookingResponse with its fixed field layout.
+
+    Reads the six fields directly into a literal dict for orjson instead of
+    going through pydantic's generic ``model_dump``; key order matches it.
+    """
+    return orjson.dumps({
+        "customer_name": booking.customer_name,
+        "technician_name": booking.technician_name,
+        "profession": booking.profession,
+        "start_time": booking.start_time,
+        "id": booking.id,
+        "end_time": booking.end_time
+    })
+
+def create_success_response(
+    data: Any,
+    metadata: Optional[Dict] = None,
+    status_code: int = status.HTTP_200_OK
+) -> Response:
+    """
+    Create a standardized success response.
+
+    Only `data` and `metadata` are serialized (with orjson, which handles
+    datetimes, UUIDs and enums natively); they are spliced into the constant
+    APIResponse envelope bytes, so FastAPI skips response-model validation and
+    ``jsonable_encoder`` and no APIResponse model is built.
+    """
+    if isinstance(data, BookingResponse):
+        data_json = _dump_booking(data)
+    else:
+        if isinstance(data, BaseModel):
+            data = data.model_dump()
+        data_json = orjson.dumps(data)
+    return _envelope_response(data_json, metadata, status_code)
+
+def _envelope_response(
+    data_json: bytes,
+    metadata: Optional[Dict] = None,
+    status_code: int = status.HTTP_200_OK
+) -> Response:
+    """Splice already-serialized `data` into the success envelope bytes."""
+    return Response(
+        content=b"".join((
+            _SUCCESS_PREFIX,
+            data_json,
+            _SUCCESS_METADATA,
+            orjson.dumps(metadata or {}),
+            _SUCCESS_SUFFIX
+        )),
         status_code=status_code,
-        content=api_response.model_dump() 
+        media_type="application/json"
     )
 
-def create_success_response(data: Any, metadata: Optional[Dict] = None) -> APIResponse:
-    """Create a standardized success response with ISO-formatted metadata."""
-    # Convert any datetime objects in metadata to ISO-formatted strings
-    if metadata:
-        metadata = {
-            key: (value.isoformat() if isinstance(value, datetime) else value)
-            for key, value in metadata.items()
-        }
-    api_response = APIResponse(
-        success=True,
-        data=data,
-        metadata=metadata or {}
-    )
-    return api_response
+def _listing_page_json(offset: int, limit: int) -> bytes:
+    """
+    Serialized `data` for one list_bookings page, reused until the store changes.
+
+    Repeated polling of the same page between writes then costs a dict
+    lookup instead of re-formatting and re-serializing every booking.
+    """
+    global _listing_cache_version
+    version = booking_service.store_version()
+    if version != _listing_cache_version:
+        _listing_cache.clear()
+        _listing_cache_version = version
+
+    data_json = _listing_cache.get((offset, limit))
+    if data_json is None:
+        page = booking_service.iter_bookings(offset=offset, limit=limit)
+        data_json = orjson.dumps({"formatted_bookings": _format_bookings(page)})
+        if len(_listing_cache) < _LISTING_CACHE_MAX_PAGES:
+            _listing_cache[(offset, limit)] = data_json
+    return data_json
+
+def _format_bookings(bookings: Iterable[Booking]) -> str:
+    """
+    Render bookings as the Markdown listing returned by `list_bookings`.
+
+    Reads the stored Booking objects directly, so no intermediate list of
+    validated BookingResponse models is built for display-only output.
+
+    Kept as a standalone loop over plain attribute reads with the time format
+    hoisted to a constant, so it is the single place to profile or specialize.
+    """
+    time_format = _DISPLAY_TIME_FORMAT
+    return "\n".join([
+        f"- **ID:** {b.id}\n"
+        f"  **Technician:** {b.technician_name}\n"
+        f"  **Profession:** {b.profession}\n"
+        f"  **Start:** {b.start_time.strftime(time_format)}\n"
+        f"  **End:** {b.end_time.strftime(time_format)}\n"
+        for b in bookings
+    ])
 
 def get_confidence_assessment(score: float) -> str:
     """Get qualitative assessment of confidence score."""
@@ -115,30 +219,26 @@ def get_confidence_assessment(score: float) -> str:
 @router.get(
     "/",
     response_model=APIResponse,
-    summary="List all bookings",
-    response_description="List of all bookings with metadata"
+    summary="List bookings",
+    response_description="A page of bookings with pagination metadata"
 )
-async def list_bookings():
-    """Retrieve all bookings with enhanced formatting for a better display."""
+async def list_bookings(
+    offset: int = Query(0, ge=0, description="Number of bookings to skip"),
+    limit: int = Query(50, ge=1, le=100, description="Maximum number of bookings to return")
+):
+    """Retrieve a page of bookings with enhanced formatting for a better display."""
     try:
-        bookings = booking_service.get_all_bookings()
-
-        formatted_bookings = "\n".join([
-            f"- **ID:** {b.id}\n"
-            f"  **Technician:** {b.technician_name}\n"
-            f"  **Profession:** {b.profession}\n"
-            f"  **Start:** {b.start_time.strftime('%Y-%m-%d %I:%M %p')}\n"
-            f"  **End:** {b.end_time.strftime('%Y-%m-%d %I:%M %p')}\n"
-            for b in bookings
-        ])
-        
-        return create_success_response(
-            data={"formatted_bookings": formatted_bookings},
-            metadata={
-                "total_count": len(bookings),
-                "timestamp": datetime.now().isoformat()
-            }
-        )
+        total_count = booking_service.count_bookings()
+        metadata = {
+            "total_count": total_count,
+            "offset": offset,
+            "limit": limit,
+            "timestamp": current_iso_timestamp()
+        }
+        if offset >= total_count:
+            return create_success_response(data=_EMPTY_BOOKINGS_DATA, metadata=metadata)
+
+        return _envelope_response(_listing_page_json(offset, limit), metadata)
     except Exception as e:
         logger.error(f"Failed to list bookings: {str(e)}", exc_info=True)
         return create_error_response(
@@ -152,7 +252,7 @@ async def list_bookings():
     response_model=APIResponse,
     summary="Retrieve booking details"
 )
-async def retrieve_booking(booking_id: str):
+async def retrieve_booking(booking_id: UUID):
     """Retrieve a specific booking with enhanced error handling."""
     try:
         booking = booking_service.get_booking_by_id(booking_id)
@@ -162,21 +262,11 @@ async def retrieve_booking(booking_id: str):
                 "BOOKING_NOT_FOUND",
                 f"Booking {booking_id} not found"
             )
-        
-        # Manually construct BookingResponse with ISO-formatted datetime fields
-        booking_data = {
-            "id": booking.id,
-            "customer_name": booking.customer_name,
-            "technician_name": booking.technician_name,
-            "profession": booking.profession,
-            "start_time": booking.start_time.isoformat(),
-            "end_time": booking.end_time.isoformat()
-        }
-        booking_response = BookingResponse(**booking_data)
-        
+
+        # orjson serializes the datetime fields natively
         return create_success_response(
-            data=booking_response,
-            metadata={"retrieved_at": datetime.now().isoformat()}
+            data=booking,
+            metadata={"retrieved_at": current_iso_timestamp()}
         )
     except Exception as e:
         logger.error(f"Error retrieving booking {booking_id}: {str(e)}", exc_info=True)
@@ -194,34 +284,26 @@ async def retrieve_booking(booking_id: str):
 async def create_booking(booking_data: BookingCreate):
     """Create a new booking with enhanced validation."""
     try:
-        new_booking = booking_service.create_booking(booking_data)
-        
-        # Manually construct BookingResponse with ISO-formatted datetime fields
-        booking_response_data = {
-            "id": new_booking.id,
-            "customer_name": new_booking.customer_name or "Anonymous Customer",
-            "technician_name": new_booking.technician_name,
-            "profession": new_booking.profession,
-            "start_time": new_booking.start_time.isoformat(), 
-            "end_time": new_booking.end_time.isoformat()  
-        }
-
-        booking_response = BookingResponse(**booking_response_data) 
+        booking_response = booking_service.create_booking(booking_data)
+        if booking_response.customer_name is None:
+            booking_response = booking_response.model_copy(
+                update={"customer_name": "Anonymous Customer"}
+            )
 
-        
         return create_success_response(
             data=booking_response,
             metadata={
-                "created_at": datetime.utcnow().isoformat() + "Z",
+                "created_at": current_utc_timestamp(),
                 "booking_duration": "1 hour"
-            }
+            },
+            status_code=status.HTTP_201_CREATED
         )
     except ValueError as ve:
         return create_error_response(
             status.HTTP_400_BAD_REQUEST,
             "BOOKING_CREATION_FAILED",
             str(ve),
-            details={"provided_data": booking_data.dict()}
+            details={"provided_data": booking_data.model_dump(mode="json")}
         )
     except Exception as e:
         logger.error(f"Error creating booking: {str(e)}", exc_info=True)
@@ -231,12 +313,58 @@ async def create_booking(booking_data: BookingCreate):
             "Failed to create booking"
         )
 
+@router.post(
+    "/batch",
+    response_model=APIResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create several bookings at once"
+)
+async def create_bookings_batch(items: List[BookingCreate]):
+    """Create a batch of bookings atomically: either every row is booked or none."""
+    try:
+        booking_responses = booking_service.create_bookings_bulk(items)
+        data_json = b"".join((
+            b'{"bookings":[',
+            b",".join(
+                _dump_booking(
+                    booking_response.model_copy(update={"customer_name": "Anonymous Customer"})
+                    if booking_response.customer_name is None else booking_response
+                )
+                for booking_response in booking_responses
+            ),
+            b'],"created_count":',
+            str(len(booking_responses)).encode(),
+            b"}"
+        ))
+        return _envelope_response(
+            data_json,
+            metadata={
+                "created_at": current_utc_timestamp(),
+                "booking_duration": "1 hour"
+            },
+            status_code=status.HTTP_201_CREATED
+        )
+    except ValueError as ve:
+        return create_error_response(
+            status.HTTP_400_BAD_REQUEST,
+            "BOOKING_CREATION_FAILED",
+            str(ve),
+            details={"batch_size": len(items)}
+        )
+    except Exception as e:
+        logger.error(f"Error creating booking batch: {str(e)}", exc_info=True)
+        return create_error_response(
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            "INTERNAL_ERROR",
+            "Failed to create bookings"
+        )
+
 @router.delete(
     "/{booking_id}",
     response_model=APIResponse,
     summary="Cancel booking"
 )
-async def cancel_booking(booking_id: str):
+async def cancel_booking(booking_id: UUID):
     """Cancel a booking with enhanced error handling."""
     try:
         if not booking_service.cancel_booking(booking_id):
@@ -248,7 +376,7 @@ async def cancel_booking(booking_id: str):
         
         return create_success_response(
             data={"booking_id": booking_id, "status": "cancelled"},
-            metadata={"cancelled_at": datetime.now().isoformat()}
+            metadata={"cancelled_at": current_iso_timestamp()}
         )
     except Exception as e:
         logger.error(f"Error cancelling booking {booking_id}: {str(e)}", exc_info=True)
@@ -266,12 +394,16 @@ async def cancel_booking(booking_id: str):
 async def process_command(command: CommandRequest):
     """Process natural language commands with enhanced analysis."""
     try:
-        # Get intent classification with confidence scores
-        intent, scores = nlp_service.classify_intent(command.message)
+        # Get intent classification with confidence scores. The classifier is
+        # pure and spends its time in GIL-releasing model inference, so run it
+        # off the event loop instead of stalling every other in-flight request.
+        # The first call loads the models, which must not happen on the loop either.
+        nlp_service = await run_in_threadpool(get_nlp_service)
+        intent, scores = await run_in_threadpool(nlp_service.classify_intent, command.message)
 
         # Create analysis scores
         analysis = [
-            AnalysisScore(
+            AnalysisScore.model_construct(
                 intent=intent_name,
                 confidence=score,
                 assessment=get_confidence_assessment(score)
@@ -279,30 +411,25 @@ async def process_command(command: CommandRequest):
             for intent_name, score in scores.items()
         ]
 
-        # Process the command
-        response = nlp_service.handle_message(command.message)
+        # Process the command. This waits on NER inference too, and bookings
+        # are written under the store's write lock, so it runs off the loop
+        # as well; concurrent commands then also share NER micro-batches.
+        response = await run_in_threadpool(nlp_service.handle_message, command.message)
         
-        # Extract the booking object if available
-        booking = getattr(response, "booking", None)
-        booking_response = None
-        if booking:
-            booking = booking.dict()
-            booking["start_time"] = booking["start_time"].isoformat()
-            booking["end_time"] = booking["end_time"].isoformat()
-            booking_response = BookingResponse(**booking)
-
+        # The result is dumped once by create_success_response; an attached
+        # BookingResponse is already a trusted schema and is passed through as-is.
         return create_success_response(
-            data=CommandResult(
+            data=CommandResult.model_construct(
                 success=True,
                 intent=intent,
                 message=response.response,
                 analysis=analysis,
-                booking=booking_response,
+                booking=getattr(response, "booking", None),
                 metadata={
-                    "processed_at": datetime.now().isoformat(),
+                    "processed_at": current_iso_timestamp(),
                     "processing_time_ms": 0
                 }
-            ).dict(),
+            ),
             metadata={}
         )
     except Exception as e:
@@ -312,4 +439,45 @@ async def process_command(command: CommandRequest):
             "COMMAND_PROCESSING_FAILED",
             "Failed to process command",
             details={"original_command": command.message}
-        )
\ No newline at end of file
+        )
+
+@router.post(
+    "/commands/batch",
+    response_model=APIResponse,
+    summary="Process several natural language commands"
+)
+async def process_commands_batch(commands: List[CommandRequest]):
+    """
+    Process a batch of commands in order, sharing model inference between them.
+
+    Commands are handled one after another, so a booking created by one is
+    visible to the next; their intent and entity inference runs up front as
+    batched forwards (see NLPService.handle_messages).
+    """
+    try:
+        nlp_service = await run_in_threadpool(get_nlp_service)
+        responses = await run_in_threadpool(
+            nlp_service.handle_messages, [command.message for command in commands]
+        )
+        return create_success_response(
+            data={
+                "results": [
+                    {
+                        "intent": response.intent,
+                        "message": response.response,
+                        "intent_scores": response.intent_scores
+                    }
+                    for response in responses
+                ],
+                "processed_count": len(responses)
+            },
+            metadata={"processed_at": current_iso_timestamp()}
+        )
+    except Exception as e:
+        logger.error(f"Error processing command batch: {str(e)}", exc_info=True)
+        return create_error_response(
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            "COMMAND_PROCESSING_FAILED",
+            "Failed to process commands",
+            details={"batch_size": len(commands)}
+        )
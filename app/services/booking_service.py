@@ -17,81 +17,212 @@ Date   : January 2025
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-from app.models.booking import Booking
+from app.models.booking import Booking, to_epoch_micros
 from app.schemas.booking import BookingCreate, BookingResponse
-from app.services.validation import validate_booking_request
+from app.services.booking_store import BookingStore
+from app.services.validation import ensure_timezone, find_conflicting_booking, validate_booking_request
 from app.models.professions import ProfessionEnum
-from uuid import UUID
+from uuid import UUID, uuid4
 import logging
 
-# Configure logger
+# Configure logger. Hot-path calls pass %-style arguments, so no message is
+# formatted unless the record is actually emitted.
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
 # In-memory storage for Bookings
 # ---------------------------------------------------------------------------
-in_memory_bookings_db: Dict[str, Booking] = {}  # Keyed by booking.id
+# The single store behind this service: bookings, per-technician schedule
+# index, version counter and write lock (see app/services/booking_store.py).
+# All access goes through the functions below, which keep the index, the
+# version counter and the response caches in step with the bookings.
+store = BookingStore()
 
+# get_all_bookings() result for the store version it was built at; rebuilt
+# only after a write, so read-heavy listing skips per-row construction.
+_all_bookings_cache: Tuple[int, List[BookingResponse]] = (-1, [])
 
-def get_all_bookings() -> List[BookingResponse]:
+# Cache of BookingResponse objects served by get_booking_by_id, primed on
+# create and filled on read misses. Entries remember the Booking they were
+# built from, so a booking removed from (or replaced in) the store is never
+# served from a stale entry.
+_booking_response_cache: Dict[int, Tuple[Booking, BookingResponse]] = {}
+
+
+def _as_booking_key(booking_id: Union[str, UUID]) -> Optional[int]:
     """
-    Retrieve a list of all existing bookings.
+    Normalize a booking ID into the key used by the in-memory store.
+
+    The store is keyed by the UUID's 128-bit integer value: ints hash in C
+    (UUID.__hash__ is a Python-level method) and need no string allocation.
+
+    Args:
+        booking_id: A UUID (already parsed, e.g. by FastAPI) or its string form.
 
     Returns:
-        A list of BookingResponse objects in the system.
+        The integer key, or None if the string is not a valid UUID.
     """
-    bookings = list(in_memory_bookings_db.values())
-    return [BookingResponse(
+    if isinstance(booking_id, UUID):
+        return booking_id.int
+    try:
+        return UUID(booking_id).int
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+def _to_response(booking: Booking) -> BookingResponse:
+    """
+    Build the BookingResponse schema for a stored Booking.
+
+    Stored bookings were validated on creation, so the schema is assembled
+    with ``model_construct`` instead of re-running pydantic validation
+    (enum coercion, datetime parsing) for every row. The stored profession
+    string is mapped back to its enum member so serialization stays typed.
+    """
+    return BookingResponse.model_construct(
         id=booking.id,
         customer_name=booking.customer_name,
         technician_name=booking.technician_name,
-        profession=booking.profession,
+        profession=ProfessionEnum(booking.profession),
         start_time=booking.start_time,
         end_time=booking.end_time
-    ) for booking in bookings]
+    )
+
+
+def clear_bookings() -> None:
+    """
+    Remove every booking from the store, along with its index and cache.
+    """
+    with store.write_lock:
+        store.clear()
+        _booking_response_cache.clear()
+
+
+def get_all_bookings(offset: int = 0, limit: Optional[int] = None) -> List[BookingResponse]:
+    """
+    Retrieve existing bookings, optionally one page at a time.
+
+    The full response list is built once per store version and pages are
+    sliced from it, so repeated reads between writes cost a list slice.
+
+    Args:
+        offset: Number of bookings to skip (in creation order).
+        limit: Maximum number of bookings to return; None returns all of them.
+
+    Returns:
+        A list of BookingResponse objects in the system.
+    """
+    global _all_bookings_cache
+    version, responses = _all_bookings_cache
+    if version != store.version:
+        # Build from the store's immutable snapshot, so a concurrent write
+        # cannot change the bookings mid-build. The version is read first:
+        # a write landing before the snapshot leaves the result tagged stale
+        # (rebuilt on the next call) rather than passing it off as fresh.
+        version = store.version
+        responses = [_to_response(booking) for booking in store.snapshot()]
+        _all_bookings_cache = (version, responses)
+    stop = None if limit is None else offset + limit
+    return responses[offset:stop]
+
+
+def iter_bookings(offset: int = 0, limit: Optional[int] = None) -> Iterator[Booking]:
+    """
+    Iterate over the stored Booking domain objects without copying them.
+
+    Meant for read-only formatting paths that don't need validated
+    BookingResponse objects. Iterates over a snapshot of the store, so
+    concurrent writes are safe but not reflected.
+
+    Args:
+        offset: Number of bookings to skip (in creation order).
+        limit: Maximum number of bookings to yield; None yields all of them.
+
+    Returns:
+        An iterator over the Booking objects in the system.
+    """
+    return store.page(offset, limit)
+
+
+def snapshot_bookings() -> Tuple[Booking, ...]:
+    """
+    All stored Booking objects, in creation order, as an immutable copy.
+
+    Lets a caller test for emptiness and iterate over the very same bookings,
+    even while other threads create or cancel bookings.
+
+    Returns:
+        A tuple of the Booking objects in the system.
+    """
+    return store.snapshot()
+
+
+def count_bookings() -> int:
+    """
+    Count the bookings currently stored.
+
+    Returns:
+        The number of bookings in the system.
+    """
+    return len(store)
+
+
+def store_version() -> int:
+    """
+    Current version of the booking store.
 
+    Returns:
+        A counter that changes whenever a booking is created or removed, so
+        callers can reuse anything derived from the store until it moves on.
+    """
+    return store.version
 
-def get_booking_by_id(booking_id: str) -> Optional[BookingResponse]:
+
+def get_booking_by_id(booking_id: Union[str, UUID]) -> Optional[BookingResponse]:
     """
     Retrieve a specific booking by its unique ID.
 
     Args:
-        booking_id: The UUID string of the desired booking.
+        booking_id: The UUID (or UUID string) of the desired booking.
 
     Returns:
         BookingResponse if found, otherwise None.
     """
-    booking = in_memory_bookings_db.get(booking_id)
+    key = _as_booking_key(booking_id)
+    booking = store.get(key) if key is not None else None
     if booking:
-        return BookingResponse(
-            id=booking.id,
-            customer_name=booking.customer_name,
-            technician_name=booking.technician_name,
-            profession=booking.profession,
-            start_time=booking.start_time,
-            end_time=booking.end_time
-        )
-    logger.warning(f"Booking with ID {booking_id} not found.")
+        cached = _booking_response_cache.get(key)
+        if cached is not None and cached[0] is booking:
+            return cached[1]
+
+        booking_response = _to_response(booking)
+        _booking_response_cache[key] = (booking, booking_response)
+        return booking_response
+    logger.warning("Booking with ID %s not found.", booking_id)
     return None
 
 
-def delete_booking_by_id(booking_id: str) -> bool:
+def delete_booking_by_id(booking_id: Union[str, UUID]) -> bool:
     """
     Remove a booking from the system by ID.
 
     Args:
-        booking_id: The UUID of the booking to remove.
+        booking_id: The UUID (or UUID string) of the booking to remove.
 
     Returns:
         True if the booking was found and removed; False otherwise.
     """
-    if booking_id in in_memory_bookings_db:
-        del in_memory_bookings_db[booking_id]
-        logger.info(f"Booking with ID {booking_id} has been deleted.")
+    key = _as_booking_key(booking_id)
+    with store.write_lock:
+        removed = store.remove(key) if key is not None else None
+        if removed is not None:
+            _booking_response_cache.pop(key, None)
+    if removed is not None:
+        logger.info("Booking with ID %s has been deleted.", booking_id)
         return True
-    logger.warning(f"Attempted to delete non-existent booking with ID {booking_id}.")
+    logger.warning("Attempted to delete non-existent booking with ID %s.", booking_id)
     return False
 
 
@@ -109,49 +240,185 @@ def create_booking(booking_data: BookingCreate, system_init: bool = False) -> Bo
     Raises:
         ValueError: If the booking violates any business rules or constraints.
     """
-    start_time = booking_data.start_time
-    end_time = start_time + timedelta(hours=1)
-
-    # Validate the booking request against business rules
-    validate_booking_request(
-        start_time=start_time,
-        end_time=end_time,
+    return create_booking_from_fields(
+        customer_name=booking_data.customer_name,
         technician_name=booking_data.technician_name,
         profession=booking_data.profession,
-        existing_bookings=in_memory_bookings_db,
+        start_time=booking_data.start_time,
         system_init=system_init
     )
 
-    # Create a new Booking instance
-    new_booking = Booking(
-        customer_name=booking_data.customer_name,
-        technician_name=booking_data.technician_name,
-        profession=booking_data.profession.value,  # Extract string from enum
-        start_time=start_time,
-        end_time=end_time
-    )
 
-    # Add the new booking to the in-memory database
-    in_memory_bookings_db[new_booking.id] = new_booking
-    logger.info(f"New booking created with ID: {new_booking.id}")
-
-    # Return the BookingResponse schema
-    return BookingResponse(
-        id=new_booking.id,
-        customer_name=new_booking.customer_name,
-        technician_name=new_booking.technician_name,
-        profession=new_booking.profession,
-        start_time=new_booking.start_time,
-        end_time=new_booking.end_time
-    )
+def create_booking_from_fields(
+    customer_name: Optional[str],
+    technician_name: str,
+    profession: ProfessionEnum,
+    start_time: datetime,
+    system_init: bool = False
+) -> BookingResponse:
+    """
+    Create a new booking from already-typed fields.
 
+    Lets internal callers that hold the individual values (e.g. the NLP
+    service) skip building a BookingCreate schema only for it to be unpacked
+    again; the business rules are enforced exactly as in `create_booking`.
 
-def cancel_booking(booking_id: str) -> bool:
+    Args:
+        customer_name: Name of the customer requesting the service.
+        technician_name: Name of the technician performing the service.
+        profession: Profession of the technician.
+        start_time: Scheduled start time of the service.
+        system_init: When True, bypasses time validation for system initialization.
+
+    Returns:
+        The newly created BookingResponse (schema model).
+
+    Raises:
+        ValueError: If the booking violates any business rules or constraints.
+    """
+    start_time = ensure_timezone(start_time)
+    end_time = start_time + timedelta(hours=1)
+
+    with store.write_lock:
+        # Validate the booking request against business rules
+        validate_booking_request(
+            start_time=start_time,
+            end_time=end_time,
+            technician_name=technician_name,
+            profession=profession,
+            existing_bookings=store.schedule(technician_name.lower()),
+            system_init=system_init
+        )
+
+        # Create a new Booking instance
+        booking_key = uuid4()
+        new_booking = Booking(
+            id=str(booking_key),
+            customer_name=customer_name,
+            technician_name=technician_name,
+            profession=profession.value,  # Extract string from enum
+            start_time=start_time,
+            end_time=end_time
+        )
+
+        # Add the new booking to the in-memory database
+        store.add(booking_key.int, new_booking)
+
+        # Build the BookingResponse schema once and prime the retrieval cache
+        # with it, before a concurrent cancel can remove the booking
+        booking_response = _to_response(new_booking)
+        _booking_response_cache[booking_key.int] = (new_booking, booking_response)
+    logger.info("New booking created with ID: %s", new_booking.id)
+    return booking_response
+
+
+def create_bookings_bulk(
+    items: List[BookingCreate],
+    system_init: bool = False
+) -> List[BookingResponse]:
+    """
+    Create several bookings at once, all or nothing.
+
+    Every row is validated against the stored bookings and against the rows
+    before it in the same batch; nothing is stored unless all rows pass. Each
+    touched technician's schedule is copied once for the whole batch, and the
+    store version moves once rather than once per booking.
+
+    Args:
+        items: Booking details, in the order they should be created.
+        system_init: When True, bypasses time validation for system initialization.
+
+    Returns:
+        The newly created BookingResponse objects, in input order.
+
+    Raises:
+        ValueError: If any row violates a business rule; the message names the
+            first failing row (1-based) and nothing is created.
+    """
+    with store.write_lock:
+        pending_schedules: Dict[str, List[Booking]] = {}
+        new_bookings: List[Tuple[int, Booking]] = []
+
+        for position, booking_data in enumerate(items, start=1):
+            start_time = ensure_timezone(booking_data.start_time)
+            end_time = start_time + timedelta(hours=1)
+            schedule = store.staged_schedule(pending_schedules, booking_data.technician_name.lower())
+
+            try:
+                validate_booking_request(
+                    start_time=start_time,
+                    end_time=end_time,
+                    technician_name=booking_data.technician_name,
+                    profession=booking_data.profession,
+                    existing_bookings=schedule,
+                    system_init=system_init
+                )
+            except ValueError as ve:
+                raise ValueError(f"Booking #{position}: {ve}") from ve
+
+            booking_key = uuid4()
+            new_booking = Booking(
+                id=str(booking_key),
+                customer_name=booking_data.customer_name,
+                technician_name=booking_data.technician_name,
+                profession=booking_data.profession.value,  # Extract string from enum
+                start_time=start_time,
+                end_time=end_time
+            )
+            store.stage(pending_schedules, new_booking)
+            new_bookings.append((booking_key.int, new_booking))
+
+        # Every row passed: publish the whole batch
+        responses = []
+        for booking_key, new_booking in new_bookings:
+            booking_response = _to_response(new_booking)
+            _booking_response_cache[booking_key] = (new_booking, booking_response)
+            responses.append(booking_response)
+        if new_bookings:
+            store.add_many(new_bookings, pending_schedules)
+    logger.info("Created %d bookings in one batch.", len(new_bookings))
+    return responses
+
+
+def seed_bookings(records: Iterable[BookingCreate]) -> None:
+    """
+    Load known-good bookings (e.g. the startup seed set) without validation.
+
+    Skips the past-time, profession and conflict checks that `create_booking`
+    runs for user requests, and publishes the whole set with a single store
+    update. Callers must only pass bookings they know to be valid and free of
+    overlaps; anything user-supplied goes through `create_booking`.
+
+    Args:
+        records: Booking details to store as-is, in insertion order.
+    """
+    schedules: Dict[str, List[Booking]] = {}
+    new_bookings: List[Tuple[int, Booking]] = []
+    with store.write_lock:
+        for booking_data in records:
+            start_time = ensure_timezone(booking_data.start_time)
+            booking_key = uuid4()
+            new_booking = Booking(
+                id=str(booking_key),
+                customer_name=booking_data.customer_name,
+                technician_name=booking_data.technician_name,
+                profession=booking_data.profession.value,  # Extract string from enum
+                start_time=start_time,
+                end_time=start_time + timedelta(hours=1)
+            )
+            store.stage(schedules, new_booking)
+            new_bookings.append((booking_key.int, new_booking))
+        if new_bookings:
+            store.add_many(new_bookings, schedules)
+    logger.info("Seeded %d bookings.", len(new_bookings))
+
+
+def cancel_booking(booking_id: Union[str, UUID]) -> bool:
     """
     Cancel (delete) a booking by its ID.
 
     Args:
-        booking_id: The booking ID to remove.
+        booking_id: The booking ID (UUID or UUID string) to remove.
 
     Returns:
         True if the booking was successfully removed, otherwise False.
@@ -161,21 +428,20 @@ def cancel_booking(booking_id: str) -> bool:
 def is_overlapping(technician_name: str, start_time: datetime) -> bool:
     """
     Checks if the technician is already booked at the given start_time.
+
+    Looks only at that technician's sorted schedule, so the check is a
+    single bisect rather than a scan over every booking.
     
     Args:
-        technician_name: Name of the technician
+        technician_name: Name of the technician (matched case-insensitively)
         start_time: Proposed booking start time
         
     Returns:
         bool: True if there is an overlap, False otherwise
     """
-    end_time = start_time + timedelta(hours=1)
-    
-    # Convert dict values to list for iteration
-    bookings = list(in_memory_bookings_db.values())
-    
-    for booking in bookings:
-        if booking.technician_name == technician_name:
-            if max(start_time, booking.start_time) < min(end_time, booking.end_time):
-                return True
-    return False
\ No newline at end of file
+    schedule = store.schedule(technician_name.lower())
+    if not schedule:
+        return False
+    start_ts = to_epoch_micros(ensure_timezone(start_time))
+    end_ts = to_epoch_micros(ensure_timezone(start_time + timedelta(hours=1)))
+    return find_conflicting_booking(schedule, start_ts, end_ts) is not None
@@ -0,0 +1,177 @@
+"""
+==========================================================
+            TECHNICIAN BOOKING SYSTEM - STORE
+==========================================================
+
+  Holds the in-memory state behind the booking service:
+
+  - The bookings themselves, keyed by the UUID's integer value
+  - A per-technician index of bookings sorted by start time
+  - A version counter that moves on every write
+  - The lock that serializes writers
+
+  Business rules live in the booking service; the store only
+  keeps its structures consistent with each other, so another
+  backend can be swapped in behind the same interface.
+
+  Author : Ericson Willians
+  Email  : ericsonwillians@protonmail.com
+  Date   : January 2025
+
+==========================================================
+"""
+
+import threading
+from bisect import bisect_left, insort
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from app.models.booking import Booking
+
+# Sort key of every schedule in the index; shared with the conflict check,
+# which bisects the same schedules.
+start_ts_of = attrgetter("start_ts")
+
+
+class BookingStore:
+    """
+    In-memory booking storage with a per-technician schedule index.
+
+    Write methods expect the caller to hold `write_lock`, so a conflict check
+    and the write it guards can run as one atomic step. Point reads (`get`,
+    `schedule`) are lock-free; listings (`page`) read an immutable snapshot
+    of the bookings, so writers on other threads never change a dict under
+    an iterating reader.
+
+    Attributes:
+        bookings (Dict[int, Booking]): Stored bookings keyed by UUID(booking.id).int,
+            in insertion order.
+        technician_index (Dict[str, List[Booking]]): Lowercased technician name
+            to that technician's bookings, sorted by start_ts.
+        version (int): Bumped on every write, so read-side caches can tell
+            whether the store changed.
+        write_lock (threading.Lock): Serializes writers.
+    """
+
+    def __init__(self) -> None:
+        self.bookings: Dict[int, Booking] = {}
+        self.technician_index: Dict[str, List[Booking]] = {}
+        self.version = 0
+        self.write_lock = threading.Lock()
+        # Bookings in insertion order as of the last write; None once a write
+        # invalidates it, rebuilt by the next listing
+        self._snapshot: Optional[Tuple[Booking, ...]] = None
+
+    def __len__(self) -> int:
+        return len(self.bookings)
+
+    def get(self, key: int) -> Optional[Booking]:
+        """Return the booking stored under `key`, or None."""
+        return self.bookings.get(key)
+
+    def schedule(self, technician_lower: str) -> Sequence[Booking]:
+        """Return a technician's bookings sorted by start_ts (empty if none)."""
+        return self.technician_index.get(technician_lower, ())
+
+    def snapshot(self) -> Tuple[Booking, ...]:
+        """
+        Return every stored booking, in insertion order, as an immutable copy.
+
+        The copy is taken under `write_lock` and reused until the next write,
+        so readers never walk the live dict while another thread mutates it.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self.write_lock:
+                snapshot = self._snapshot
+                if snapshot is None:
+                    snapshot = self._snapshot = tuple(self.bookings.values())
+        return snapshot
+
+    def page(self, offset: int = 0, limit: Optional[int] = None) -> Iterator[Booking]:
+        """Iterate over one page of the stored bookings' snapshot, in insertion order."""
+        snapshot = self.snapshot()
+        if offset == 0 and limit is None:
+            return iter(snapshot)
+        stop = None if limit is None else offset + limit
+        return iter(snapshot[offset:stop])
+
+    def add(self, key: int, booking: Booking) -> None:
+        """Store a booking and insert it into its technician's schedule."""
+        self.bookings[key] = booking
+        schedule = self.technician_index.setdefault(booking.technician_name_lower, [])
+        insort(schedule, booking, key=start_ts_of)
+        self._bump()
+
+    def staged_schedule(
+        self,
+        staged: Dict[str, List[Booking]],
+        technician_lower: str
+    ) -> List[Booking]:
+        """
+        Return a batch's working copy of a technician's schedule.
+
+        The indexed schedule is copied into `staged` on first use, so a batch
+        can validate and insert against it without touching the index until
+        `add_many` publishes it.
+        """
+        schedule = staged.get(technician_lower)
+        if schedule is None:
+            schedule = staged[technician_lower] = list(self.schedule(technician_lower))
+        return schedule
+
+    def stage(self, staged: Dict[str, List[Booking]], booking: Booking) -> None:
+        """Insert a booking into its technician's working schedule in `staged`."""
+        schedule = self.staged_schedule(staged, booking.technician_name_lower)
+        insort(schedule, booking, key=start_ts_of)
+
+    def add_many(
+        self,
+        new_bookings: Iterable[Tuple[int, Booking]],
+        schedules: Dict[str, List[Booking]]
+    ) -> None:
+        """
+        Publish a batch of bookings with one version bump.
+
+        Args:
+            new_bookings: (key, booking) pairs to store, in insertion order.
+            schedules: Complete sorted schedules for every technician the
+                batch touches, replacing the indexed ones (see `stage`).
+        """
+        self.bookings.update(new_bookings)
+        self.technician_index.update(schedules)
+        self._bump()
+
+    def remove(self, key: int) -> Optional[Booking]:
+        """
+        Remove a booking and drop it from its technician's schedule.
+
+        Returns:
+            The removed booking, or None if nothing was stored under `key`.
+        """
+        booking = self.bookings.pop(key, None)
+        if booking is None:
+            return None
+        technician = booking.technician_name_lower
+        schedule = self.technician_index.get(technician)
+        if schedule:
+            index = bisect_left(schedule, booking.start_ts, key=start_ts_of)
+            while index < len(schedule) and schedule[index] is not booking:
+                index += 1
+            if index < len(schedule):
+                del schedule[index]
+            if not schedule:
+                del self.technician_index[technician]
+        self._bump()
+        return booking
+
+    def clear(self) -> None:
+        """Remove every booking and empty the index."""
+        self.bookings.clear()
+        self.technician_index.clear()
+        self._bump()
+
+    def _bump(self) -> None:
+        """Record a write: move the version on and drop the listing snapshot."""
+        self._snapshot = None
+        self.version += 1
@@ -26,23 +26,34 @@ Date   : January 2025
 """
 
 import logging
+import os
 import re
-from typing import Optional, Tuple, Dict
-from datetime import datetime, timedelta
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, time, timedelta
+from pathlib import Path
+
+from app.config.settings import settings
+
+# OpenMP/MKL size their thread pools when torch is first imported, so the
+# environment has to be set before transformers pulls torch in
+if settings.TORCH_THREADS > 0:
+    os.environ.setdefault("OMP_NUM_THREADS", str(settings.TORCH_THREADS))
+    os.environ.setdefault("MKL_NUM_THREADS", str(settings.TORCH_THREADS))
 
 from transformers import pipeline
 from dateutil import parser
 
 from app.models.professions import ProfessionEnum
 from app.services.booking_service import (
-    create_booking,
+    create_booking_from_fields,
     get_booking_by_id,
     cancel_booking,
-    get_all_bookings,  # Ensure this function exists in booking_service.py
 )
-from app.schemas.booking import BookingCreate
-from app.config.settings import settings
 from app.utils.datetime_utils import DateTimeExtractor, DateTimeExtractionError
+from app.utils.batching import BatchScheduler
 from app.services import booking_service
 
 from dataclasses import dataclass, field
@@ -56,32 +67,61 @@ class MessageResponse:
     """Data class to encapsulate the response message and intent scores."""
     response: str
     intent_scores: Dict[str, float]
+    # The intent the message was handled as; "unknown" when classification
+    # or handling failed
+    intent: str = "unknown"
+
+
+class _IntentCacheKey(str):
+    """
+    A message normalized for the classification cache (stripped, lowercased).
+
+    Compares and hashes as the normalized text, so phrasings that differ only
+    in case or surrounding whitespace share a cache entry, while `original`
+    keeps the text as written for the zero-shot model.
+    """
+
+    def __new__(cls, text: str) -> "_IntentCacheKey":
+        key = super().__new__(cls, text.strip().lower())
+        key.original = text
+        return key
+
+
 class NLPService:
+    # ONNX Runtime model class for each pipeline task (see USE_ORT)
+    _ORT_MODEL_CLASSES = {
+        "zero-shot-classification": "ORTModelForSequenceClassification",
+        "ner": "ORTModelForTokenClassification",
+    }
+
     def __init__(self):
         """
         Initialize NLP components with improved classification.
         """
         logger.info("Initializing NLPService...")
-        
-        # Initialize Zero-Shot Classification pipeline with specific hypothesis
-        try:
-            self.intent_classifier = pipeline(
-                "zero-shot-classification",
-                model=settings.ZERO_SHOT_MODEL_NAME,
-                device=0 if self._is_gpu_available() else -1,
-            )
-            logger.info("Zero-Shot Classification pipeline initialized successfully.")
-        except Exception as e:
-            logger.error(f"Failed to initialize Zero-Shot Classification pipeline: {e}")
-            raise
+        self._configure_torch_threads()
+
+        # The zero-shot model is only needed when no intent rule decides a
+        # message, so it is loaded on first use unless preloading is requested
+        self._intent_classifier = None
+        self._intent_classifier_lock = threading.Lock()
+        # How uncached classifications were decided; cache hits are not
+        # counted, so the ratio reflects distinct messages. Classification
+        # runs on threadpool workers, hence the lock.
+        self._rule_hits = 0
+        self._zero_shot_fallbacks = 0
+        self._decision_stats_lock = threading.Lock()
+        if settings.PRELOAD_INTENT_CLASSIFIER:
+            # No other thread can see the instance yet, so no lock is needed
+            self._intent_classifier = self._load_intent_classifier()
 
         # Initialize NER pipeline
         try:
-            self.ner_pipeline = pipeline(
+            self.ner_pipeline = self._build_pipeline(
                 "ner",
-                model=settings.NER_MODEL_NAME,
+                settings.NER_MODEL_NAME,
+                "NER",
                 aggregation_strategy="simple",
-                device=0 if self._is_gpu_available() else -1,
             )
             logger.info("NER pipeline initialized successfully.")
         except Exception as e:
@@ -142,6 +182,61 @@ class NLPService:
         }
 
         self.candidate_intents = list(self.intent_patterns.keys())
+
+        # Compile the intent patterns once; matching runs against lowercased
+        # text, so no IGNORECASE is needed
+        self._intent_regexes = tuple(
+            (intent, re.compile(pattern))
+            for intent, patterns in self.intent_patterns.items()
+            for pattern in patterns
+        )
+        # All patterns as one alternation: a single scan tells whether any
+        # rule can fire, so messages no rule matches skip the per-pattern loop
+        self._intent_prefilter = re.compile(
+            "|".join(f"(?:{regex.pattern})" for _, regex in self._intent_regexes)
+        )
+
+        # Zero-shot candidate labels and their intents never change; build once
+        self.candidate_labels = []
+        self.label_map = {}
+        for intent, descriptions in self.intent_descriptions.items():
+            for desc in descriptions:
+                self.candidate_labels.append(desc)
+                self.label_map[desc] = intent
+
+        # Concurrent requests share forward passes: each call submits one text
+        # and a worker runs the pipeline once per collected batch.
+        self._intent_batcher = BatchScheduler(
+            self._classify_batch,
+            max_batch_size=settings.NLP_BATCH_SIZE,
+            max_wait_ms=settings.NLP_BATCH_WAIT_MS,
+            name="intent-batcher"
+        )
+        self._ner_batcher = BatchScheduler(
+            self._ner_batch,
+            max_batch_size=settings.NLP_BATCH_SIZE,
+            max_wait_ms=settings.NLP_BATCH_WAIT_MS,
+            name="ner-batcher"
+        )
+
+        # Classification results keyed by normalized message text. Users repeat
+        # the same phrasings ("list bookings"), and process_command classifies
+        # each message twice; a hit skips the transformer entirely.
+        self._classify_cached = lru_cache(maxsize=settings.INTENT_CACHE_SIZE)(
+            self._classify_normalized
+        )
+        # Entity extraction runs here while the calling thread classifies the
+        # intent; the two models are independent, so a message costs the slower
+        # of the two instead of their sum. Sized so concurrent messages can
+        # still fill a NER batch.
+        self._entity_pool = ThreadPoolExecutor(
+            max_workers=settings.NLP_BATCH_SIZE, thread_name_prefix="nlp-entities"
+        )
+
+        # NER output per raw message. Only the model's entities are cached;
+        # datetimes are still resolved per call, so "tomorrow" stays relative
+        # to the current day.
+        self._ner_cached = lru_cache(maxsize=settings.NER_CACHE_SIZE)(self._recognize_entities)
         
         self.booking_id_pattern = re.compile(
             r'\b(?:booking\s+id|booking-id|booking)\s*(?:is|=)?\s*([A-Za-z0-9-]+)\b',
@@ -161,6 +256,84 @@ class NLPService:
             ProfessionEnum.TEACHER: r'\b(?:teach(?:er)?|tutor|instructor|educator)\b',
             ProfessionEnum.WELDER: r'\b(?:weld(?:er|ing)|metal\s*work(?:er)?)\b'
         }
+        # One alternation with a named group per profession: a single scan
+        # finds the earliest mention and which profession it belongs to
+        self._profession_regex = re.compile(
+            "|".join(f"(?P<{profession.name}>{pattern})"
+                     for profession, pattern in self.profession_patterns.items()),
+            re.IGNORECASE
+        )
+
+        if settings.NLP_WARMUP:
+            self._warm_up()
+
+    @property
+    def intent_classifier(self):
+        """
+        The zero-shot classification pipeline, loaded on first access.
+
+        Raises:
+            Exception: If the pipeline cannot be created.
+        """
+        if self._intent_classifier is None:
+            with self._intent_classifier_lock:
+                if self._intent_classifier is None:
+                    self._intent_classifier = self._load_intent_classifier()
+        return self._intent_classifier
+
+    def _load_intent_classifier(self):
+        """Create the zero-shot classification pipeline used as the intent fallback."""
+        try:
+            intent_classifier = self._build_pipeline(
+                "zero-shot-classification",
+                settings.ZERO_SHOT_MODEL_NAME,
+                "Zero-Shot Classification",
+            )
+            logger.info("Zero-Shot Classification pipeline initialized successfully.")
+            return intent_classifier
+        except Exception as e:
+            logger.error(f"Failed to initialize Zero-Shot Classification pipeline: {e}")
+            raise
+
+    def _configure_torch_threads(self) -> None:
+        """
+        Pins torch's intra-op thread count to TORCH_THREADS, if set.
+
+        Each uvicorn worker loads its own models; letting every worker spawn one
+        thread per core oversubscribes the CPU. Inter-op parallelism is set to a
+        single thread, since each forward is already parallel within its ops.
+        """
+        if settings.TORCH_THREADS <= 0:
+            return
+        try:
+            import torch
+
+            torch.set_num_threads(settings.TORCH_THREADS)
+            torch.set_num_interop_threads(1)
+            logger.info(f"Torch limited to {settings.TORCH_THREADS} intra-op threads.")
+        except ImportError:
+            logger.warning("Torch not installed. Thread settings not applied.")
+        except RuntimeError as e:
+            # Inter-op threads can only be set before any parallel work ran
+            logger.warning(f"Could not set torch inter-op threads: {e}")
+
+    def _warm_up(self) -> None:
+        """
+        Runs one forward through each loaded pipeline with a canned message.
+
+        The first call pays for kernel selection, allocator growth and (with
+        USE_TORCH_COMPILE) compilation; doing it at startup keeps that spike
+        off the first user request. The intent classifier is only warmed
+        when PRELOAD_INTENT_CLASSIFIER loaded it at startup.
+        """
+        sample = "Book Bob Smith the plumber for tomorrow at 10 am"
+        try:
+            self._ner_batch([sample])
+            if self._intent_classifier is not None:
+                self._classify_batch([sample])
+            logger.info("NLP pipelines warmed up.")
+        except Exception as e:
+            logger.warning(f"NLP warm-up failed: {e}")
 
     def _is_gpu_available(self) -> bool:
         """
@@ -176,18 +349,282 @@ class NLPService:
             logger.warning("Torch not installed. Running on CPU.")
             return False
 
+    def _build_pipeline(self, task: str, model_name: str, name: str, **kwargs):
+        """
+        Creates a Hugging Face pipeline on the best available backend.
+
+        On CPU with USE_ORT enabled, the model runs on ONNX Runtime with full
+        graph optimization (see `_load_ort_model`); otherwise it runs on
+        PyTorch with the optimizations from `_optimize_pipeline`. On GPU with
+        USE_HALF_PRECISION enabled, the weights are loaded directly in FP16;
+        with USE_INT8_QUANTIZATION they are loaded in INT8 instead (see
+        `_load_int8_gpu_pipeline`).
+
+        Args:
+            task: Pipeline task, e.g. "ner".
+            model_name: Hugging Face model id.
+            name: Human-readable pipeline name for logs.
+            **kwargs: Extra pipeline arguments.
+
+        Returns:
+            The ready-to-use pipeline.
+        """
+        device = 0 if self._is_gpu_available() else -1
+        if settings.USE_ORT and device == -1:
+            ort_model = self._load_ort_model(task, model_name, name)
+            if ort_model is not None:
+                from transformers import AutoTokenizer
+
+                tokenizer = AutoTokenizer.from_pretrained(model_name)
+                return pipeline(task, model=ort_model, tokenizer=tokenizer, **kwargs)
+        if device >= 0 and settings.USE_INT8_QUANTIZATION:
+            int8_pipeline = self._load_int8_gpu_pipeline(task, model_name, name, **kwargs)
+            if int8_pipeline is not None:
+                return int8_pipeline
+        if device >= 0 and settings.USE_HALF_PRECISION:
+            import torch
+
+            nlp_pipeline = pipeline(
+                task, model=model_name, device=device, torch_dtype=torch.float16, **kwargs
+            )
+            model = nlp_pipeline.model
+            model.forward = self._float32_logits(model.forward)
+            logger.info(f"{name} pipeline loaded in FP16.")
+        else:
+            nlp_pipeline = pipeline(task, model=model_name, device=device, **kwargs)
+        return self._optimize_pipeline(nlp_pipeline, name)
+
+    def _load_int8_gpu_pipeline(self, task: str, model_name: str, name: str, **kwargs):
+        """
+        Builds a GPU pipeline whose Linear layers are bitsandbytes INT8.
+
+        Placement is left to accelerate (device_map="auto"), so no device is
+        passed to the pipeline. The INT8 matmuls produce FP16 outputs, so the
+        logits are cast back to FP32 as in the FP16 path. torch.compile is not
+        applied, since it does not trace through the bitsandbytes kernels.
+
+        Returns:
+            The pipeline, or None if bitsandbytes is unavailable or loading
+            fails, in which case the caller falls back to FP16/FP32.
+        """
+        try:
+            nlp_pipeline = pipeline(
+                task,
+                model=model_name,
+                model_kwargs={"load_in_8bit": True, "device_map": "auto"},
+                **kwargs
+            )
+        except Exception as e:
+            logger.warning(f"INT8 loading of the {name} pipeline failed; falling back: {e}")
+            return None
+        model = nlp_pipeline.model
+        model.forward = self._float32_logits(model.forward)
+        logger.info(f"{name} pipeline loaded in INT8 (bitsandbytes).")
+        return nlp_pipeline
+
+    def _load_ort_model(self, task: str, model_name: str, name: str):
+        """
+        Loads an ONNX Runtime model optimized at ORT_ENABLE_ALL (level 99).
+
+        The first run exports the model to ONNX, fuses LayerNorm/GELU/attention
+        and saves the result under HF_CACHE_DIR/ort/; later runs load it from
+        there. Whether ORT beats PyTorch depends on the CPU, so measure before
+        enabling USE_ORT in production.
+
+        Returns:
+            The ORT model, or None to fall back to PyTorch.
+        """
+        try:
+            import optimum.onnxruntime as ort
+            from optimum.onnxruntime.configuration import OptimizationConfig
+        except ImportError:
+            logger.warning(f"USE_ORT is set but optimum[onnxruntime] is not installed; "
+                           f"running the {name} pipeline on PyTorch.")
+            return None
+
+        model_class = getattr(ort, self._ORT_MODEL_CLASSES[task])
+        save_dir = Path(settings.HF_CACHE_DIR).expanduser() / "ort" / model_name.replace("/", "--")
+        optimized_file = "model_optimized.onnx"
+        try:
+            if not (save_dir / optimized_file).exists():
+                logger.info(f"Exporting the {name} model to ONNX in {save_dir}...")
+                exported = model_class.from_pretrained(model_name, export=True)
+                ort.ORTOptimizer.from_pretrained(exported).optimize(
+                    save_dir=save_dir,
+                    optimization_config=OptimizationConfig(
+                        optimization_level=99, optimize_for_gpu=False, fp16=False
+                    ),
+                )
+            ort_model = model_class.from_pretrained(save_dir, file_name=optimized_file)
+            logger.info(f"{name} pipeline running on ONNX Runtime.")
+            return ort_model
+        except Exception as e:
+            logger.warning(f"ONNX Runtime setup for the {name} pipeline failed; using PyTorch: {e}")
+            return None
+
+    def _optimize_pipeline(self, nlp_pipeline, name: str):
+        """
+        Applies the configured inference optimizations to a freshly built pipeline.
+
+        CPU-specific precision changes come first (see `_optimize_for_cpu`);
+        with USE_TORCH_COMPILE enabled, the model's forward pass is then
+        compiled with torch.compile. Compilation happens lazily on the first
+        calls, so it is off by default to keep development restarts fast.
+
+        Args:
+            nlp_pipeline: The Hugging Face pipeline to optimize in place.
+            name: Human-readable pipeline name for logs.
+
+        Returns:
+            The same pipeline, possibly with an optimized model.
+        """
+        self._optimize_for_cpu(nlp_pipeline, name)
+        if settings.USE_TORCH_COMPILE:
+            try:
+                import torch
+
+                # Compile the bound forward rather than swapping in the
+                # compiled wrapper module, so the pipeline keeps its model class.
+                # Message lengths vary, hence dynamic shapes.
+                model = nlp_pipeline.model
+                model.forward = torch.compile(model.forward, dynamic=True)
+                logger.info(f"{name} pipeline forward compiled with torch.compile.")
+            except Exception as e:
+                logger.warning(f"torch.compile of the {name} pipeline failed; running eagerly: {e}")
+        return nlp_pipeline
+
+    def _cpu_supports_bf16(self) -> bool:
+        """
+        Checks whether the CPU has native BF16 arithmetic (AVX512-BF16 or AMX).
+
+        Returns:
+            bool: True if BF16 matmuls run natively, False otherwise.
+        """
+        try:
+            import torch
+        except ImportError:
+            return False
+        probe = getattr(torch.cpu, "_is_avx512_bf16_supported", None)
+        if probe is not None:
+            return bool(probe())
+        try:
+            with open("/proc/cpuinfo") as cpuinfo:
+                flags = cpuinfo.read()
+        except OSError:
+            return False
+        return "avx512_bf16" in flags or "amx_bf16" in flags
+
+    @staticmethod
+    def _autocast_bf16(forward):
+        """
+        Wraps a model's forward pass to run under CPU BF16 autocast.
+
+        Weights stay in FP32; autocast runs matmuls in BF16 and the logits are
+        cast back to FP32, since pipeline post-processing goes through numpy,
+        which has no bfloat16.
+        """
+        import torch
+
+        @wraps(forward)
+        def bf16_forward(*args, **kwargs):
+            with torch.autocast(device_type="cpu", dtype=torch.bfloat16):
+                outputs = forward(*args, **kwargs)
+            outputs["logits"] = outputs["logits"].float()
+            return outputs
+
+        return bf16_forward
+
+    @staticmethod
+    def _float32_logits(forward):
+        """
+        Wraps an FP16 model's forward pass to return FP32 logits.
+
+        Pipeline post-processing runs softmax in numpy, where FP16 `exp`
+        overflows for logits above ~11.
+        """
+
+        @wraps(forward)
+        def fp32_forward(*args, **kwargs):
+            outputs = forward(*args, **kwargs)
+            outputs["logits"] = outputs["logits"].float()
+            return outputs
+
+        return fp32_forward
+
+    def _optimize_for_cpu(self, nlp_pipeline, name: str):
+        """
+        Applies CPU inference optimizations to a freshly built pipeline.
+
+        - USE_BF16: on CPUs with native BF16 support, the forward pass runs
+          under BF16 autocast, roughly doubling matmul throughput.
+        - USE_INT8_QUANTIZATION: otherwise, the model's Linear layers are
+          replaced by dynamically quantized INT8 ones (weights stored as int8,
+          activations quantized on the fly), which roughly halves memory and
+          speeds up the matmul-bound forward pass on x86 CPUs.
+
+        BF16 takes precedence when both are enabled: on BF16-capable CPUs it is
+        faster than INT8 dynamic quantization, which re-quantizes activations
+        on every call. Both are skipped on GPU.
+
+        Args:
+            nlp_pipeline: The Hugging Face pipeline to optimize in place.
+            name: Human-readable pipeline name for logs.
+
+        Returns:
+            The same pipeline, possibly with an optimized model.
+        """
+        if nlp_pipeline.device.type != "cpu":
+            return nlp_pipeline
+        if settings.USE_BF16:
+            if self._cpu_supports_bf16():
+                nlp_pipeline.model.forward = self._autocast_bf16(nlp_pipeline.model.forward)
+                logger.info(f"{name} pipeline running under BF16 autocast.")
+                return nlp_pipeline
+            logger.warning(f"CPU lacks native BF16 support; not using BF16 for the {name} pipeline.")
+        if not settings.USE_INT8_QUANTIZATION:
+            return nlp_pipeline
+        try:
+            import torch
+
+            if not {"x86", "fbgemm"} & set(torch.backends.quantized.supported_engines):
+                logger.warning(f"No INT8 engine available; keeping the {name} pipeline in FP32.")
+                return nlp_pipeline
+            nlp_pipeline.model = torch.ao.quantization.quantize_dynamic(
+                nlp_pipeline.model.eval(), {torch.nn.Linear}, dtype=torch.qint8
+            )
+            logger.info(f"{name} pipeline quantized to dynamic INT8.")
+        except Exception as e:
+            logger.warning(f"INT8 quantization of the {name} pipeline failed; keeping FP32: {e}")
+        return nlp_pipeline
+
     def classify_intent(self, text: str) -> Tuple[str, Dict[str, float]]:
         """
         Enhanced intent classification using pattern matching and zero-shot classification.
+
+        Results are cached per normalized message (stripped, lowercased), so a
+        repeated phrasing is answered without running the classifier again.
+        The zero-shot model still sees the message as written. Failed
+        classifications are not cached.
         """
         logger.debug(f"Classifying intent for text: '{text}'")
-        text_lower = text.lower()
-        
+        try:
+            return self._classify_cached(_IntentCacheKey(text))
+        except Exception as e:
+            logger.error(f"Intent classification failed: {e}")
+            return "unknown", {intent: 0.0 for intent in self.candidate_intents}
+
+    def _classify_normalized(self, text_lower: _IntentCacheKey) -> Tuple[str, Dict[str, float]]:
+        """
+        Classify a normalized message; raises if the classifier fails.
+
+        Intent rules match the lowercased text; the zero-shot fallback gets
+        the original message.
+        """
         # First try pattern matching
         pattern_scores = {}
-        for intent, patterns in self.intent_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, text_lower):
+        if self._intent_prefilter.search(text_lower):
+            for intent, regex in self._intent_regexes:
+                if regex.search(text_lower):
                     pattern_scores[intent] = pattern_scores.get(intent, 0) + 1
 
         if pattern_scores:
@@ -197,53 +634,71 @@ class NLPService:
             
             if len(matching_intents) == 1:
                 # Clear pattern match
-                logger.info(f"Clear pattern match found for intent: {matching_intents[0]}")
+                with self._decision_stats_lock:
+                    self._rule_hits += 1
+                    rule_hits, fallbacks = self._rule_hits, self._zero_shot_fallbacks
+                logger.info(f"Clear pattern match found for intent: {matching_intents[0]} "
+                            f"(rule hits: {rule_hits}, zero-shot fallbacks: {fallbacks}; cache misses only)")
                 return matching_intents[0], {intent: 1.0 if intent == matching_intents[0] else 0.0 
                                         for intent in self.candidate_intents}
         
-        # Use zero-shot classification with better prompting
-        try:
-            # Create candidate labels with descriptions
-            candidate_labels = []
-            label_map = {}
-            
-            for intent, descriptions in self.intent_descriptions.items():
-                for desc in descriptions:
-                    candidate_labels.append(desc)
-                    label_map[desc] = intent
-
-            # Run classification with multi_label=False to force single intent
-            result = self.intent_classifier(
-                text,
-                candidate_labels,
-                hypothesis_template="This request is about {}.",
-                multi_label=False
-            )
+        # Use zero-shot classification with better prompting, batched with
+        # any concurrent requests
+        with self._decision_stats_lock:
+            self._zero_shot_fallbacks += 1
+            rule_hits, fallbacks = self._rule_hits, self._zero_shot_fallbacks
+        logger.debug(f"No clear pattern match; falling back to zero-shot "
+                     f"(rule hits: {rule_hits}, zero-shot fallbacks: {fallbacks}; cache misses only)")
+        result = self._intent_batcher.submit(text_lower.original)
+        
+        # Aggregate scores by intent
+        intent_scores = {}
+        for label, score in zip(result['labels'], result['scores']):
+            intent = self.label_map[label]
+            intent_scores[intent] = max(intent_scores.get(intent, 0), score)
             
-            # Aggregate scores by intent
-            intent_scores = {}
-            for label, score in zip(result['labels'], result['scores']):
-                intent = label_map[label]
-                intent_scores[intent] = max(intent_scores.get(intent, 0), score)
-                
-            # Boost pattern-matched intents
-            if pattern_scores:
-                for intent in pattern_scores:
-                    intent_scores[intent] = min(1.0, intent_scores.get(intent, 0) * 1.5)
+        # Boost pattern-matched intents
+        if pattern_scores:
+            for intent in pattern_scores:
+                intent_scores[intent] = min(1.0, intent_scores.get(intent, 0) * 1.5)
 
-            # Get highest scoring intent
-            max_intent = max(intent_scores.items(), key=lambda x: x[1])[0]
-            
-            # Normalize scores
-            total = sum(intent_scores.values())
-            intent_scores = {k: v/total for k, v in intent_scores.items()}
-            
-            logger.info(f"Classified intent: {max_intent} with scores {intent_scores}")
-            return max_intent, intent_scores
-                
-        except Exception as e:
-            logger.error(f"Intent classification failed: {e}")
-            return "unknown", {intent: 0.0 for intent in self.candidate_intents}
+        # Get highest scoring intent
+        max_intent = max(intent_scores.items(), key=lambda x: x[1])[0]
+        
+        # Normalize scores
+        total = sum(intent_scores.values())
+        intent_scores = {k: v/total for k, v in intent_scores.items()}
+        
+        logger.info(f"Classified intent: {max_intent} with scores {intent_scores}")
+        return max_intent, intent_scores
+
+    def _classify_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Run zero-shot classification for a batch of texts in one pipeline call."""
+        # Run classification with multi_label=False to force single intent.
+        # Zero-shot scores one premise/hypothesis pair per candidate label and
+        # the pipeline defaults to batch_size=1, i.e. one forward per label;
+        # batching by the label count scores each text in a single forward.
+        results = self.intent_classifier(
+            texts if len(texts) > 1 else texts[0],
+            self.candidate_labels,
+            hypothesis_template="This request is about {}.",
+            multi_label=False,
+            batch_size=len(self.candidate_labels),
+            num_workers=0
+        )
+        return [results] if isinstance(results, dict) else results
+
+    def _ner_batch(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+        """Run NER for a batch of texts in one pipeline call."""
+        if len(texts) == 1:
+            # A single string skips the pipeline's DataLoader and padding
+            return [self.ner_pipeline(texts[0])]
+        # List inputs default to one forward per text; run them as one batch
+        return self.ner_pipeline(texts, batch_size=len(texts), num_workers=0)
+
+    def _recognize_entities(self, text: str) -> Tuple[Dict[str, Any], ...]:
+        """Run NER for one message, batched with concurrent callers."""
+        return tuple(self._ner_batcher.submit(text))
 
     def extract_entities(
         self, text: str
@@ -253,7 +708,7 @@ class NLPService:
         """
         logger.debug(f"Extracting entities from text: '{text}'")
         try:
-            entities = self.ner_pipeline(text)
+            entities = self._ner_cached(text)
             
             # Initialize return values
             profession = self.extract_profession(text)  # Extract profession first
@@ -261,8 +716,13 @@ class NLPService:
             date_time = None
             booking_id = None
 
+            # Group entity words by label in one pass over the NER output
+            words_by_group: Dict[str, List[str]] = {}
+            for ent in entities:
+                words_by_group.setdefault(ent['entity_group'], []).append(ent['word'])
+
             # Extract PERSON entities
-            persons = [ent['word'] for ent in entities if ent['entity_group'] == 'PER']
+            persons = words_by_group.get('PER', [])
             if persons:
                 technician_name = ' '.join(persons)
                 logger.info(f"Extracted technician name: {technician_name}")
@@ -271,16 +731,20 @@ class NLPService:
                 logger.info("Using default technician name")
 
             # Extract datetime entities with better handling
-            date_entities = [ent['word'] for ent in entities if ent['entity_group'] == 'DATE']
-            time_entities = [ent['word'] for ent in entities if ent['entity_group'] == 'TIME']
+            date_entities = words_by_group.get('DATE', [])
+            time_entities = words_by_group.get('TIME', [])
             
             datetime_str = f"{' '.join(date_entities)} {' '.join(time_entities)}".strip()
+            # One clock read per message; both extraction attempts resolve
+            # relative dates against the same instant
+            now = datetime.now(self.datetime_extractor.timezone_obj)
 
             if datetime_str:
                 try:
                     extracted_datetime = self.datetime_extractor.extract_datetime_entities(
                         {"date": ' '.join(date_entities), "time": ' '.join(time_entities)},
-                        datetime_str
+                        datetime_str,
+                        now
                     )
                     date_time = extracted_datetime.get("start_time")
                     if date_time:
@@ -288,10 +752,13 @@ class NLPService:
                 except DateTimeExtractionError as e:
                     logger.error(f"Failed to parse explicit datetime: {e}")
 
-            # If no datetime found, try parsing from full text
-            if not date_time:
+            # If no datetime found, try parsing from full text. Messages that
+            # mention no date or time at all ("list my bookings") skip this;
+            # for them it could only produce the default that create_booking
+            # applies anyway.
+            if not date_time and self.datetime_extractor.has_datetime_hint(text):
                 try:
-                    extracted = self.datetime_extractor.extract_datetime_entities({}, text)
+                    extracted = self.datetime_extractor.extract_datetime_entities({}, text, now)
                     date_time = extracted.get("start_time")
                     if date_time:
                         logger.info(f"Extracted datetime from full text: {date_time}")
@@ -326,17 +793,47 @@ class NLPService:
         Returns:
             ProfessionEnum or None: Extracted profession if found
         """
-        text_lower = text.lower()
-        
-        # Try to match profession patterns
-        for profession, pattern in self.profession_patterns.items():
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                logger.info(f"Matched profession {profession.value} with pattern")
-                return profession
-                
+        match = self._profession_regex.search(text)
+        if match:
+            profession = ProfessionEnum[match.lastgroup]
+            logger.info(f"Matched profession {profession.value} with pattern")
+            return profession
+
         logger.debug("No profession pattern matched")
         return None
 
+    def handle_messages(
+        self, messages: List[str], customer_name: str = "Anonymous Customer"
+    ) -> List[MessageResponse]:
+        """
+        Processes several messages, sharing transformer forwards between them.
+
+        The model work (intent classification and NER) for all messages is
+        submitted at once, so the batch workers run it as a few batched
+        forwards and leave the results in the per-message caches. The
+        messages are then handled one by one, in order, so bookings created
+        or cancelled by earlier messages are visible to later ones.
+
+        Args:
+            messages: Messages to process.
+            customer_name: Customer the messages are processed for.
+
+        Returns:
+            List[MessageResponse]: One response per message, in order.
+        """
+        prefetches = [
+            self._entity_pool.submit(model_call, message)
+            for message in dict.fromkeys(messages)
+            for model_call in (self.classify_intent, self._ner_cached)
+        ]
+        for prefetch in prefetches:
+            try:
+                prefetch.result()
+            except Exception as e:
+                # Handling the message below retries and reports the failure
+                logger.warning(f"Batched model prefetch failed: {e}")
+        return [self.handle_message(message, customer_name) for message in messages]
+
     def handle_message(
     self, message: str, customer_name: str = "Anonymous Customer"
 ) -> MessageResponse:
@@ -347,6 +844,9 @@ class NLPService:
         try:
             logger.info(f"Handling message: '{message}' from customer: '{customer_name}'")
             
+            # Extract entities in the background while the intent is classified
+            entities_future = self._entity_pool.submit(self.extract_entities, message)
+
             # Get intent and scores
             intent, intent_scores = self.classify_intent(message)
             
@@ -359,110 +859,130 @@ class NLPService:
                 
             # Extract entities with proper error handling
             try:
-                profession, technician_name, date_time, booking_id = self.extract_entities(message)
+                profession, technician_name, date_time, booking_id = entities_future.result()
             except Exception as e:
                 logger.error(f"Entity extraction failed: {e}")
                 return MessageResponse(
                     response=f"I had trouble understanding the details of your request: {str(e)}",
-                    intent_scores=intent_scores
+                    intent_scores=intent_scores,
+                    intent=intent
                 )
 
             # Handle each intent
             if intent == "create_booking":
+                current_time = datetime.now(settings.TIMEZONE_OBJ)
+
                 # Set up default datetime if none extracted
                 if not date_time:
-                    tomorrow = datetime.now(settings.TIMEZONE_OBJ) + timedelta(days=1)
-                    date_time = tomorrow.replace(
-                        hour=settings.DEFAULT_BOOKING_HOUR,
-                        minute=0,
-                        second=0,
-                        microsecond=0
+                    date_time = datetime.combine(
+                        current_time.date() + timedelta(days=1),
+                        time(settings.DEFAULT_BOOKING_HOUR),
+                        tzinfo=current_time.tzinfo
                     )
                     logger.info(f"Using default booking time: {date_time}")
 
                 # Validate booking time
-                current_time = datetime.now(settings.TIMEZONE_OBJ)
                 if date_time <= current_time:
                     return MessageResponse(
                         response="Cannot book a technician in the past.",
-                        intent_scores=intent_scores
+                        intent_scores=intent_scores,
+                        intent=intent
+                    )
+
+                if not technician_name or not profession:
+                    missing = "technician name" if not technician_name else "profession"
+                    return MessageResponse(
+                        response=f"Failed to create booking: please specify the {missing}.",
+                        intent_scores=intent_scores,
+                        intent=intent
                     )
 
                 try:
-                    booking_create = BookingCreate(
+                    # Entities are already typed, so skip the BookingCreate round-trip
+                    booking_response = create_booking_from_fields(
                         customer_name=customer_name,
                         technician_name=technician_name,
                         profession=profession,
                         start_time=date_time
                     )
-
-                    booking_response = create_booking(booking_create)
                     formatted_time = booking_response.start_time.strftime("%A at %I:%M %p")
                     response = f"Booking confirmed for {formatted_time} with {booking_response.technician_name} (ID: {booking_response.id})"
                     logger.info(f"Booking created successfully: {response}")
-                    return MessageResponse(response=response, intent_scores=intent_scores)
+                    return MessageResponse(response=response, intent_scores=intent_scores, intent=intent)
                 except ValueError as ve:
                     error_msg = f"Failed to create booking: {str(ve)}"
                     logger.error(error_msg)
-                    return MessageResponse(response=error_msg, intent_scores=intent_scores)
+                    return MessageResponse(response=error_msg, intent_scores=intent_scores, intent=intent)
 
             elif intent == "query_booking":
                 if not booking_id:
                     return MessageResponse(
                         response="Please provide your booking ID to retrieve details.",
-                        intent_scores=intent_scores
+                        intent_scores=intent_scores,
+                        intent=intent
                     )
 
                 booking = get_booking_by_id(booking_id)
                 if booking:
                     formatted_time = booking.start_time.strftime("%A at %I:%M %p")
                     response = f"Your booking ID is {booking.id} for a {booking.profession} on {formatted_time}."
-                    return MessageResponse(response=response, intent_scores=intent_scores)
+                    return MessageResponse(response=response, intent_scores=intent_scores, intent=intent)
                 else:
                     return MessageResponse(
                         response=f"No booking found with ID {booking_id}.",
-                        intent_scores=intent_scores
+                        intent_scores=intent_scores,
+                        intent=intent
                     )
 
             elif intent == "cancel_booking":
                 if not booking_id:
                     return MessageResponse(
                         response="Please provide the booking ID you wish to cancel.",
-                        intent_scores=intent_scores
+                        intent_scores=intent_scores,
+                        intent=intent
                     )
 
                 success = cancel_booking(booking_id)
                 if success:
                     return MessageResponse(
                         response=f"Booking ID {booking_id} cancelled successfully.",
-                        intent_scores=intent_scores
+                        intent_scores=intent_scores,
+                        intent=intent
                     )
                 else:
                     return MessageResponse(
                         response=f"No booking found with ID {booking_id} to cancel.",
-                        intent_scores=intent_scores
+                        intent_scores=intent_scores,
+                        intent=intent
                     )
 
             elif intent == "list_bookings":
-                bookings = get_all_bookings()
+                # One snapshot for both the emptiness check and the listing,
+                # so concurrent writes can neither break nor empty the loop
+                bookings = booking_service.snapshot_bookings()
                 if bookings:
-                    response = "Here are all your bookings:\n"
-                    for booking in bookings:
-                        response += f"- ID: {booking.id}, Technician: {booking.technician_name}, "
-                        response += f"Profession: {booking.profession}, "
-                        response += f"Start: {booking.start_time.strftime('%Y-%m-%d %I:%M %p')}\n"
-                    return MessageResponse(response=response, intent_scores=intent_scores)
+                    # Join the stored bookings directly; no BookingResponse
+                    # objects are built for display text.
+                    response = "Here are all your bookings:\n" + "".join(
+                        f"- ID: {booking.id}, Technician: {booking.technician_name}, "
+                        f"Profession: {booking.profession}, "
+                        f"Start: {booking.start_time.strftime('%Y-%m-%d %I:%M %p')}\n"
+                        for booking in bookings
+                    )
+                    return MessageResponse(response=response, intent_scores=intent_scores, intent=intent)
                 else:
                     return MessageResponse(
                         response="You have no bookings at the moment.",
-                        intent_scores=intent_scores
+                        intent_scores=intent_scores,
+                        intent=intent
                     )
 
             else:
                 logger.warning(f"Unrecognized intent: {intent}")
                 return MessageResponse(
                     response="I'm sorry, I didn't understand that request. Could you please rephrase it?",
-                    intent_scores=intent_scores
+                    intent_scores=intent_scores,
+                    intent=intent
                 )
 
         except Exception as e:
@@ -473,8 +993,34 @@ class NLPService:
             )
 
 
-# Create a global NLPService instance to be imported by other modules
-nlp_service = NLPService()
+# The process-wide service built by get_nlp_service(), and the lock that
+# makes sure concurrent first calls build it only once
+_nlp_service: Optional[NLPService] = None
+_nlp_service_lock = threading.Lock()
+
+
+def get_nlp_service() -> NLPService:
+    """
+    Returns the process-wide NLPService, creating it on first call.
+
+    Models are loaded when a caller first needs them rather than at import,
+    so importing this module (the API router, the CLI) stays cheap and
+    workers that never handle a command never load them. Set NLP_EAGER_INIT
+    to load them during application startup instead.
+
+    Callers racing on the first call (threadpool workers serving concurrent
+    requests) wait for a single construction instead of each loading the
+    models and starting their own batcher threads.
+
+    Raises:
+        Exception: If a pipeline fails to initialize; the next call retries.
+    """
+    global _nlp_service
+    if _nlp_service is None:
+        with _nlp_service_lock:
+            if _nlp_service is None:
+                _nlp_service = NLPService()
+    return _nlp_service
 
 
 # Example Usage (For Testing Purposes)
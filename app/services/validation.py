@@ -13,17 +13,65 @@
 ==========================================================
 """
 
+from bisect import bisect_left
 from datetime import datetime, timedelta
-from typing import Optional, Dict
+from time import time_ns
+from typing import Optional, Sequence
 from zoneinfo import ZoneInfo
 from app.config.settings import settings
-from app.models.booking import Booking
+from app.models.booking import Booking, to_epoch_micros
+from app.services.booking_store import start_ts_of
+
+# Supported professions (lowercased) and their listing for error messages,
+# built once at import rather than on every validation.
+_ALLOWED_PROFESSIONS = frozenset(prof.lower() for prof in settings.PROFESSION_KEYWORDS)
+_ALLOWED_PROFESSIONS_MSG = ", ".join(sorted(_ALLOWED_PROFESSIONS))
+
+
+def ensure_timezone(value: datetime) -> datetime:
+    """
+    Attach the configured TIMEZONE to a naive datetime.
+
+    Args:
+        value: A naive or timezone-aware datetime.
+
+    Returns:
+        The datetime unchanged if already aware, otherwise the same wall-clock
+        time in settings.TIMEZONE.
+    """
+    if value.tzinfo is None:
+        return value.replace(tzinfo=ZoneInfo(settings.TIMEZONE))
+    return value
+
+
+def find_conflicting_booking(
+    technician_bookings: Sequence[Booking],
+    start_ts: int,
+    end_ts: int
+) -> Optional[Booking]:
+    """
+    Finds a booking in a technician's schedule overlapping [start_ts, end_ts).
+
+    The schedule must be sorted by start_ts and free of overlaps (which the
+    booking service guarantees), so end times are sorted as well and only the
+    last booking starting before `end_ts` can overlap: one bisect plus a
+    single comparison instead of a scan over every booking. Times are epoch
+    microseconds (see `Booking.start_ts`), so every comparison is on ints.
+
+    Returns:
+        The conflicting booking, or None if the slot is free.
+    """
+    index = bisect_left(technician_bookings, end_ts, key=start_ts_of)
+    if index and technician_bookings[index - 1].end_ts > start_ts:
+        return technician_bookings[index - 1]
+    return None
+
 
 def validate_booking_time(
     start_time: datetime,
     end_time: Optional[datetime] = None,
     technician_name: Optional[str] = None,
-    existing_bookings: Optional[Dict[str, Booking]] = None,
+    existing_bookings: Optional[Sequence[Booking]] = None,
     system_init: bool = False
 ) -> None:
     """
@@ -31,20 +79,22 @@ def validate_booking_time(
     - The start time is in the future (unless `system_init` is True)
     - Bookings are exactly 1 hour long
     - No scheduling conflicts exist for the technician
+
+    `existing_bookings` is the technician's own schedule, sorted by start time.
     """
 
     # Ensure start_time is timezone-aware
-    if start_time.tzinfo is None:
-        start_time = start_time.replace(tzinfo=ZoneInfo(settings.TIMEZONE))
+    start_time = ensure_timezone(start_time)
 
-    # Ensure current_time is timezone-aware
-    current_time = datetime.now(ZoneInfo(settings.TIMEZONE))
+    start_ts = to_epoch_micros(start_time)
 
     # Ensure end_time is timezone-aware if provided
-    if end_time and end_time.tzinfo is None:
-        end_time = end_time.replace(tzinfo=ZoneInfo(settings.TIMEZONE))
+    if end_time:
+        end_time = ensure_timezone(end_time)
 
-    if not system_init and start_time < current_time:
+    # Only the ordering against "now" matters, so compare epoch microseconds
+    # with the raw clock instead of building a tz-aware datetime
+    if not system_init and start_ts < time_ns() // 1000:
         raise ValueError("Cannot book a technician in the past.")
 
     # Enforce one-hour duration
@@ -57,14 +107,15 @@ def validate_booking_time(
 
     # Check for technician scheduling conflicts
     if technician_name and existing_bookings:
-        for booking in existing_bookings.values():
-            if booking.technician_name.lower() == technician_name.lower():
-                if not (end_time <= booking.start_time or start_time >= booking.end_time):
-                    raise ValueError(
-                        f"Time conflict: {technician_name} is already booked "
-                        f"from {booking.start_time.strftime('%Y-%m-%d %I:%M %p')} "
-                        f"to {booking.end_time.strftime('%Y-%m-%d %I:%M %p')}."
-                    )
+        booking = find_conflicting_booking(
+            existing_bookings, start_ts, to_epoch_micros(end_time)
+        )
+        if booking is not None:
+            raise ValueError(
+                f"Time conflict: {technician_name} is already booked "
+                f"from {booking.start_time.strftime('%Y-%m-%d %I:%M %p')} "
+                f"to {booking.end_time.strftime('%Y-%m-%d %I:%M %p')}."
+            )
 
 
 def validate_profession(profession: str) -> None:
@@ -77,14 +128,10 @@ def validate_profession(profession: str) -> None:
     Raises:
         ValueError: If the profession is not recognized or not allowed
     """
-    allowed_professions = {
-        prof.lower() for prof in settings.PROFESSION_KEYWORDS.keys()
-    }
-
-    if profession.lower() not in allowed_professions:
+    if profession.lower() not in _ALLOWED_PROFESSIONS:
         raise ValueError(
             f"Unsupported profession '{profession}'. "
-            f"Valid options: {', '.join(sorted(allowed_professions))}."
+            f"Valid options: {_ALLOWED_PROFESSIONS_MSG}."
         )
 
 
@@ -93,7 +140,7 @@ def validate_booking_request(
     end_time: Optional[datetime],
     technician_name: str,
     profession: str,
-    existing_bookings: Dict[str, Booking],
+    existing_bookings: Sequence[Booking],
     system_init: bool = False
 ) -> None:
     """
@@ -104,7 +151,7 @@ def validate_booking_request(
         end_time: The proposed booking end time
         technician_name: The name of the technician
         profession: The technician's profession
-        existing_bookings: Dictionary of current bookings in the system
+        existing_bookings: The technician's current bookings, sorted by start time
         system_init: When True, bypasses past-time validation for system initialization
     
     Raises:
@@ -0,0 +1,92 @@
+# app/utils/batching.py
+
+"""
+Micro-batching for model inference.
+
+Concurrent callers each submit a single input; a background worker collects
+whatever arrives within a short window and runs one batched call for all of
+them, so tokenization and forward passes are amortized across requests.
+"""
+
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from time import monotonic
+from typing import Callable, Generic, List, Sequence, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class BatchScheduler(Generic[T, R]):
+    """
+    Collects concurrent single-item calls into batched calls on a worker thread.
+
+    Args:
+        run_batch: Callable mapping a list of inputs to a list of results, in order.
+        max_batch_size: Upper bound on inputs per batched call.
+        max_wait_ms: How long the worker waits for more inputs after the first.
+        name: Name of the worker thread (for logs and debugging).
+    """
+
+    def __init__(
+        self,
+        run_batch: Callable[[List[T]], Sequence[R]],
+        max_batch_size: int = 16,
+        max_wait_ms: float = 5.0,
+        name: str = "batch-scheduler"
+    ) -> None:
+        self._run_batch = run_batch
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_wait = max_wait_ms / 1000.0
+        self._queue: "queue.Queue[Tuple[T, Future]]" = queue.Queue()
+        self._worker = threading.Thread(target=self._serve, name=name, daemon=True)
+        self._worker.start()
+
+    def submit(self, item: T) -> R:
+        """
+        Run `item` as part of the next batch and wait for its result.
+
+        Raises:
+            Exception: Whatever the batched call raised, re-raised in every caller.
+        """
+        future: Future = Future()
+        self._queue.put((item, future))
+        return future.result()
+
+    def _collect(self) -> List[Tuple[T, Future]]:
+        """Block for one request, then gather more until the window or batch fills."""
+        batch = [self._queue.get()]
+        deadline = monotonic() + self._max_wait
+        while len(batch) < self._max_batch_size:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _serve(self) -> None:
+        while True:
+            batch = self._collect()
+            try:
+                results = self._run_batch([item for item, _ in batch])
+            except Exception as e:
+                logger.error(f"Batched inference failed for {len(batch)} inputs: {e}")
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            if len(results) != len(batch):
+                # Never leave a caller blocked on a future nobody will resolve
+                e = RuntimeError(f"Batched call returned {len(results)} results for {len(batch)} inputs")
+                logger.error(str(e))
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
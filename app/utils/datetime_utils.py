@@ -2,8 +2,9 @@
 
 import re
 import logging
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, List, Tuple, Union
 from datetime import datetime, timedelta, time
+from time import gmtime, strftime, time as epoch_seconds
 from dataclasses import dataclass, field
 from zoneinfo import ZoneInfo
 from dateutil import parser
@@ -13,6 +14,40 @@ from app.config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Response-metadata timestamps only need second granularity, so each ISO
+# string is built once per second and reused by every request in between.
+_local_timestamp: Tuple[int, str] = (-1, "")
+_utc_timestamp: Tuple[int, str] = (-1, "")
+
+
+def current_iso_timestamp() -> str:
+    """
+    Current local time as an ISO 8601 string, at second granularity.
+
+    Returns:
+        str: e.g. "2025-01-15T10:00:00", rebuilt at most once per second.
+    """
+    global _local_timestamp
+    now = int(epoch_seconds())
+    if _local_timestamp[0] != now:
+        _local_timestamp = (now, datetime.fromtimestamp(now).isoformat())
+    return _local_timestamp[1]
+
+
+def current_utc_timestamp() -> str:
+    """
+    Current UTC time as an ISO 8601 string with a "Z" suffix, at second granularity.
+
+    Returns:
+        str: e.g. "2025-01-15T10:00:00Z", rebuilt at most once per second.
+    """
+    global _utc_timestamp
+    now = int(epoch_seconds())
+    if _utc_timestamp[0] != now:
+        _utc_timestamp = (now, strftime("%Y-%m-%dT%H:%M:%SZ", gmtime(now)))
+    return _utc_timestamp[1]
+
+
 class DateTimeExtractionError(Exception):
     """Base exception for datetime extraction errors."""
     pass
@@ -52,6 +87,25 @@ class DateTimeExtractor:
         "midday": (12, 0),
     }
 
+    # Explicit clock times such as "3pm" or "10:30 am"; matched against lowercased text
+    TIME_PATTERN = re.compile(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)')
+
+    # Whole-word weekday and relative-day names, longest first so that
+    # "day after tomorrow" wins over "tomorrow" and "thurs" over "thu"
+    WEEKDAY_PATTERN = re.compile(
+        r'\b(' + '|'.join(sorted(WEEKDAYS, key=len, reverse=True)) + r')\b'
+    )
+    RELATIVE_DAY_PATTERN = re.compile(
+        r'\b(' + '|'.join(sorted(RELATIVE_DAYS, key=len, reverse=True)).replace(' ', r'\s+') + r')\b'
+    )
+
+    # What dateutil needs to find a date once weekdays are ruled out: a digit
+    # or a month name. Text with neither is rejected without parsing.
+    DATE_HINT_PATTERN = re.compile(
+        r'\d|\b(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?'
+        r'|aug(?:ust)?|sept?(?:ember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\b'
+    )
+
     RELATIVE_TIME_PATTERNS = [
         (r'in\s+(\d+)\s+hour(?:s)?', lambda m: timedelta(hours=int(m.group(1)))),
         (r'in\s+(\d+)\s+minute(?:s)?', lambda m: timedelta(minutes=int(m.group(1)))),
@@ -62,29 +116,39 @@ class DateTimeExtractor:
     ]
 
     def __init__(self):
-        """Initialize with timezone and current time."""
+        """Initialize with the configured timezone."""
         self.timezone = settings.TIMEZONE or "UTC"
         try:
             self.timezone_obj = ZoneInfo(self.timezone)
-            self.current_time = datetime.now(self.timezone_obj)
             self.business_hours = BusinessHours()
             logger.info(f"DateTimeExtractor initialized with timezone: {self.timezone}")
         except Exception as e:
             logger.error(f"Failed to set timezone {self.timezone}. Defaulting to UTC. Error: {e}")
             self.timezone = "UTC"
             self.timezone_obj = ZoneInfo("UTC")
-            self.current_time = datetime.now(self.timezone_obj)
 
-    def extract_datetime_entities(self, entities: Dict[str, Any], text: str) -> Dict[str, Any]:
-        """Main entry point for datetime extraction."""
+    def extract_datetime_entities(
+        self, entities: Dict[str, Any], text: str, now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Main entry point for datetime extraction.
+
+        Args:
+            entities: Entity dict to fill with "start_time".
+            text: Message to extract the datetime from.
+            now: Reference time for relative expressions. Read from the clock
+                once per call when omitted, and shared by every helper so a
+                whole message is interpreted against one instant.
+        """
+        if now is None:
+            now = datetime.now(self.timezone_obj)
         try:
             # Try explicit time pattern first
-            time_pattern = r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)'
-            time_match = re.search(time_pattern, text.lower())
+            time_match = self._search_clock_time(text.lower())
             
-            base_date = self._extract_date_component(text)
+            base_date = self._extract_date_component(text, now)
             if not base_date:
-                base_date = self.current_time + timedelta(days=1)
+                base_date = now + timedelta(days=1)
             
             if time_match:
                 # Extract hour and minute from the match
@@ -128,32 +192,54 @@ class DateTimeExtractor:
             entities["start_time"] = self.business_hours._next_business_day()
             return entities
         
-    def _extract_date_component(self, text: str) -> Optional[datetime]:
+    def has_datetime_hint(self, text: str) -> bool:
+        """
+        Whether the text mentions a date or time at all.
+
+        True if it contains a digit, a month, weekday or relative-day name;
+        without any of these, `extract_datetime_entities` can only fall back
+        to tomorrow at the default booking hour.
+        """
+        text_lower = text.lower()
+        return bool(
+            self.DATE_HINT_PATTERN.search(text_lower)
+            or self.WEEKDAY_PATTERN.search(text_lower)
+            or self.RELATIVE_DAY_PATTERN.search(text_lower)
+        )
+
+    def _extract_date_component(self, text: str, now: datetime) -> Optional[datetime]:
         """Extract date component from text."""
         text_lower = text.lower()
-        
-        # Check for weekdays
-        for weekday, day_num in self.WEEKDAYS.items():
-            if weekday in text_lower:
-                return self._next_weekday(self.current_time, day_num)
-                
-        # Try fuzzy parsing as last resort
+
+        # Common shapes ("friday at 3 pm", "tomorrow morning") resolve from a
+        # precompiled scan; dateutil's fuzzy parse only runs on a miss
+        day_num = self._match_weekday(text_lower)
+        if day_num is not None:
+            return self._next_weekday(now, day_num)
+
+        days_ahead = self._match_relative_days(text_lower)
+        if days_ahead is not None:
+            return now + timedelta(days=days_ahead)
+
+        # Try fuzzy parsing as last resort, unless there is nothing to parse;
+        # a fuzzy parse walks the whole string before giving up
+        if not self.DATE_HINT_PATTERN.search(text_lower):
+            return None
         try:
-            parsed_date = parser.parse(text, fuzzy=True, default=self.current_time)
-            if parsed_date < self.current_time:
-                return self.current_time + timedelta(days=1)
+            parsed_date = parser.parse(text, fuzzy=True, default=now)
+            if parsed_date < now:
+                return now + timedelta(days=1)
             return parsed_date
         except:
             return None
 
-    def _extract_relative_datetime(self, text: str) -> Optional[datetime]:
+    def _extract_relative_datetime(self, text: str, now: datetime) -> Optional[datetime]:
         """Extract datetime from relative expressions with preserved time specifications."""
         text_lower = text.lower()
         
         # First try to extract any explicit time
         explicit_time = None
-        time_pattern = r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)'
-        time_match = re.search(time_pattern, text_lower)
+        time_match = self._search_clock_time(text_lower)
         if time_match:
             hour = int(time_match.group(1))
             minute = int(time_match.group(2)) if time_match.group(2) else 0
@@ -168,86 +254,101 @@ class DateTimeExtractor:
             explicit_time = time(hour=hour, minute=minute)
 
         # Check for weekdays
-        for weekday, day_num in self.WEEKDAYS.items():
-            if weekday in text_lower:
-                target_date = self._next_weekday(self.current_time, day_num)
-                if explicit_time:
-                    return target_date.replace(
-                        hour=explicit_time.hour,
-                        minute=explicit_time.minute,
-                        second=0,
-                        microsecond=0
-                    )
-                else:
-                    # Only use default hour if no time was specified
-                    return target_date.replace(
-                        hour=settings.DEFAULT_BOOKING_HOUR,
-                        minute=0,
-                        second=0,
-                        microsecond=0
-                    )
+        day_num = self._match_weekday(text_lower)
+        if day_num is not None:
+            target_date = self._next_weekday(now, day_num)
+            if explicit_time:
+                return target_date.replace(
+                    hour=explicit_time.hour,
+                    minute=explicit_time.minute,
+                    second=0,
+                    microsecond=0
+                )
+            else:
+                # Only use default hour if no time was specified
+                return target_date.replace(
+                    hour=settings.DEFAULT_BOOKING_HOUR,
+                    minute=0,
+                    second=0,
+                    microsecond=0
+                )
 
         # Check for relative days
-        for rel_day, days_ahead in self.RELATIVE_DAYS.items():
-            if rel_day in text_lower:
-                base_date = self.current_time + timedelta(days=days_ahead)
-                
-                if explicit_time:
-                    return base_date.replace(
-                        hour=explicit_time.hour,
-                        minute=explicit_time.minute,
-                        second=0,
-                        microsecond=0
-                    )
-                    
-                # Check for time period in the same phrase
-                for period, (hour, minute) in self.TIME_PERIODS.items():
-                    if period in text_lower:
-                        return base_date.replace(
-                            hour=hour,
-                            minute=minute,
-                            second=0,
-                            microsecond=0
-                        )
-                
-                # No time specified, use default booking hour
+        days_ahead = self._match_relative_days(text_lower)
+        if days_ahead is not None:
+            base_date = now + timedelta(days=days_ahead)
+
+            if explicit_time:
                 return base_date.replace(
-                    hour=settings.DEFAULT_BOOKING_HOUR,
-                    minute=0,
+                    hour=explicit_time.hour,
+                    minute=explicit_time.minute,
                     second=0,
                     microsecond=0
                 )
 
+            # Check for time period in the same phrase
+            for period, (hour, minute) in self.TIME_PERIODS.items():
+                if period in text_lower:
+                    return base_date.replace(
+                        hour=hour,
+                        minute=minute,
+                        second=0,
+                        microsecond=0
+                    )
+
+            # No time specified, use default booking hour
+            return base_date.replace(
+                hour=settings.DEFAULT_BOOKING_HOUR,
+                minute=0,
+                second=0,
+                microsecond=0
+            )
+
         return None
 
+    def _search_clock_time(self, text_lower: str) -> Optional[re.Match]:
+        """Find an explicit "3pm"/"10:30 am" time in lowercased text."""
+        # Substring checks are far cheaper than a regex scan and rule out
+        # most messages, which carry no am/pm at all
+        if "am" not in text_lower and "pm" not in text_lower:
+            return None
+        return self.TIME_PATTERN.search(text_lower)
+
+    def _match_weekday(self, text_lower: str) -> Optional[int]:
+        """Return the weekday number (Monday=0) named in the text, if any."""
+        match = self.WEEKDAY_PATTERN.search(text_lower)
+        return self.WEEKDAYS[match.group(1)] if match else None
+
+    def _match_relative_days(self, text_lower: str) -> Optional[int]:
+        """Return the day offset of a relative-day phrase ("tomorrow" -> 1), if any."""
+        match = self.RELATIVE_DAY_PATTERN.search(text_lower)
+        if not match:
+            return None
+        # "day  after tomorrow" -> "day after tomorrow"
+        return self.RELATIVE_DAYS[' '.join(match.group(1).split())]
+
     def _next_weekday(self, ref_date: datetime, weekday: int) -> datetime:
         """Get the next occurrence of a weekday."""
-        days_ahead = weekday - ref_date.weekday()
-        if days_ahead <= 0:  # Target day already happened this week
-            days_ahead += 7
-        next_date = ref_date + timedelta(days=days_ahead)
-        return next_date
+        # 1..7 days ahead; today's weekday maps to a week from now
+        days_ahead = (weekday - ref_date.weekday() - 1) % 7 + 1
+        return ref_date + timedelta(days=days_ahead)
 
-    def _fuzzy_parse_datetime(self, text: str) -> datetime:
+    def _fuzzy_parse_datetime(self, text: str, now: datetime) -> datetime:
         """Fuzzy parse datetime with better handling of relative terms."""
         try:
-            parsed = parser.parse(text, fuzzy=True, default=self.current_time)
+            parsed = parser.parse(text, fuzzy=True, default=now)
             
             # Handle past dates
-            if parsed < self.current_time:
-                if any(rel in text.lower() for rel in self.RELATIVE_DAYS.keys()):
+            if parsed < now:
+                days_ahead = self._match_relative_days(text.lower())
+                if days_ahead is not None:
                     # Relative date reference, adjust forward
-                    days_ahead = 1  # Default to tomorrow
-                    for rel_day, days in self.RELATIVE_DAYS.items():
-                        if rel_day in text.lower():
-                            days_ahead = days
-                            break
-                    parsed = self.current_time + timedelta(days=days_ahead)
-                
-                elif parsed.date() == self.current_time.date():
-                    # Same day but past time, try to interpret as next occurrence
-                    if parsed.time() < self.current_time.time():
-                        parsed = parsed + timedelta(days=1)
+                    parsed = now + timedelta(days=days_ahead)
+
+                elif parsed.date() == now.date():
+                    # Same day but past time (implied by parsed < now), so
+                    # the next occurrence is tomorrow
+                    parsed += timedelta(days=1)
 
             return parsed
                 
@@ -255,14 +356,11 @@ class DateTimeExtractor:
             logger.error(f"Fuzzy parsing failed: {e}")
             raise DateTimeExtractionError(f"Could not parse datetime from: {text}")
 
-    def _default_booking_time(self) -> datetime:
+    def _default_booking_time(self, now: datetime) -> datetime:
         """Get default booking time (next business day)."""
-        next_day = self.current_time + timedelta(days=1)
-        return next_day.replace(
-            hour=settings.DEFAULT_BOOKING_HOUR,
-            minute=0,
-            second=0,
-            microsecond=0,
+        return datetime.combine(
+            now.date() + timedelta(days=1),
+            time(settings.DEFAULT_BOOKING_HOUR),
             tzinfo=self.timezone_obj
         )
 
@@ -298,17 +396,12 @@ class BusinessHours:
             return dt.replace(hour=self.open_hour, minute=0, second=0, microsecond=0)
         
         # If after business hours, move to next day
-        next_day = dt + timedelta(days=1)
         logger.warning(f"Requested time {dt.strftime('%I:%M %p')} is after business hours, moving to next day")
-        return next_day.replace(hour=self.open_hour, minute=0, second=0, microsecond=0)
+        return datetime.combine(dt.date() + timedelta(days=1), time(self.open_hour), tzinfo=dt.tzinfo)
 
     def _next_business_day(self) -> datetime:
         """Get next business day starting time."""
-        now = datetime.now(self.timezone_obj)
-        next_day = now + timedelta(days=1)
-        return next_day.replace(
-            hour=self.open_hour,
-            minute=0,
-            second=0,
-            microsecond=0
+        today = datetime.now(self.timezone_obj).date()
+        return datetime.combine(
+            today + timedelta(days=1), time(self.open_hour), tzinfo=self.timezone_obj
         )
\ No newline at end of file
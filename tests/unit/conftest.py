@@ -0,0 +1,57 @@
+# tests/unit/conftest.py
+
+import pytest
+
+from app.config.settings import settings
+from app.services.nlp_service import NLPService
+
+
+class FakeZeroShot:
+    """Stands in for the zero-shot pipeline; records inputs and favours the first label."""
+
+    def __init__(self):
+        self.inputs = []
+
+    def __call__(self, texts, labels, **kwargs):
+        batch = [texts] if isinstance(texts, str) else texts
+        self.inputs.extend(batch)
+        results = [
+            {"sequence": text, "labels": list(labels), "scores": [0.9] + [0.01] * (len(labels) - 1)}
+            for text in batch
+        ]
+        return results[0] if isinstance(texts, str) else results
+
+
+class FakeNER:
+    """Stands in for the NER pipeline; tags capitalized word pairs as people."""
+
+    def __call__(self, texts, **kwargs):
+        batch = [texts] if isinstance(texts, str) else texts
+        results = [self._tag(text) for text in batch]
+        return results[0] if isinstance(texts, str) else results
+
+    @staticmethod
+    def _tag(text):
+        words = text.split()
+        return [
+            {"entity_group": "PER", "word": f"{first} {last}", "score": 0.99}
+            for first, last in zip(words, words[1:])
+            if first.istitle() and last.istitle() and first.isalpha() and last.isalpha()
+        ]
+
+
+@pytest.fixture
+def zero_shot():
+    return FakeZeroShot()
+
+
+@pytest.fixture
+def nlp(monkeypatch, zero_shot):
+    """NLPService wired to fake pipelines, so no models are downloaded."""
+    fakes = {"zero-shot-classification": zero_shot, "ner": FakeNER()}
+    monkeypatch.setattr(settings, "NLP_WARMUP", False)
+    monkeypatch.setattr(settings, "PRELOAD_INTENT_CLASSIFIER", False)
+    monkeypatch.setattr(
+        NLPService, "_build_pipeline", lambda self, task, model_name, name, **kwargs: fakes[task]
+    )
+    return NLPService()
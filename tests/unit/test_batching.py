@@ -0,0 +1,67 @@
+# tests/unit/test_batching.py
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.utils.batching import BatchScheduler
+
+
+def run_concurrently(scheduler, items):
+    """Submit every item from its own thread and return the results in input order."""
+    with ThreadPoolExecutor(max_workers=len(items)) as pool:
+        return list(pool.map(scheduler.submit, items))
+
+
+def test_results_follow_input_order():
+    """Test that each caller gets the result for its own input."""
+    scheduler = BatchScheduler(lambda items: [item * 10 for item in items], max_wait_ms=20)
+    items = list(range(8))
+    assert run_concurrently(scheduler, items) == [item * 10 for item in items]
+
+
+def test_batches_flush_at_max_size():
+    """Test that no batched call receives more than max_batch_size inputs."""
+    sizes = []
+    release = threading.Event()
+
+    def run_batch(items):
+        release.wait(timeout=1)
+        sizes.append(len(items))
+        return items
+
+    scheduler = BatchScheduler(run_batch, max_batch_size=3, max_wait_ms=50)
+    with ThreadPoolExecutor(max_workers=7) as pool:
+        futures = [pool.submit(scheduler.submit, item) for item in range(7)]
+        release.set()
+        assert sorted(future.result(timeout=5) for future in futures) == list(range(7))
+    assert sum(sizes) == 7
+    assert max(sizes) <= 3
+
+
+def test_errors_reach_every_caller():
+    """Test that an exception from the batched call is raised in each caller."""
+    def run_batch(items):
+        raise ValueError("model failed")
+
+    scheduler = BatchScheduler(run_batch, max_wait_ms=20)
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [pool.submit(scheduler.submit, item) for item in range(3)]
+        for future in futures:
+            with pytest.raises(ValueError, match="model failed"):
+                future.result(timeout=5)
+
+    # The worker keeps serving after a failed batch
+    scheduler._run_batch = lambda items: items
+    assert scheduler.submit(1) == 1
+
+
+def test_short_result_list_fails_callers():
+    """Test that a batch returning too few results fails its callers instead of hanging them."""
+    scheduler = BatchScheduler(lambda items: items[:-1], max_wait_ms=20)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(scheduler.submit, item) for item in range(2)]
+        for future in futures:
+            with pytest.raises(RuntimeError, match="results for"):
+                future.result(timeout=5)
@@ -14,9 +14,9 @@ from app.config.settings import settings
 @pytest.fixture(autouse=True)
 def clear_bookings():
     """Clear the in-memory booking database before and after each test."""
-    booking_service.in_memory_bookings_db.clear()
+    booking_service.clear_bookings()
     yield
-    booking_service.in_memory_bookings_db.clear()
+    booking_service.clear_bookings()
 
 @pytest.fixture
 def sample_booking_data():
@@ -67,6 +67,38 @@ class TestBookingCreation:
         with pytest.raises(ValueError, match="Time conflict"):  # Just match the start of the error message
             booking_service.create_booking(booking_create)
 
+    def test_cancelled_slot_can_be_rebooked(self, sample_booking_data, create_sample_booking):
+        """Test that cancelling frees the slot and adjacent slots never conflict."""
+        next_slot = dict(sample_booking_data, start_time=sample_booking_data["start_time"] + timedelta(hours=1))
+        booking_service.create_booking(BookingCreate(**next_slot))
+
+        assert booking_service.cancel_booking(create_sample_booking.id)
+        rebooked = booking_service.create_booking(BookingCreate(**sample_booking_data))
+        assert rebooked.start_time == sample_booking_data["start_time"]
+
+    def test_bulk_creation_is_all_or_nothing(self, sample_booking_data):
+        """Test that a batch with a conflicting row creates nothing."""
+        first = BookingCreate(**sample_booking_data)
+        second = BookingCreate(**dict(sample_booking_data, start_time=sample_booking_data["start_time"] + timedelta(hours=1)))
+
+        with pytest.raises(ValueError, match="Booking #3: Time conflict"):
+            booking_service.create_bookings_bulk([first, second, first])
+        assert booking_service.count_bookings() == 0
+
+        created = booking_service.create_bookings_bulk([second, first])
+        assert [b.start_time for b in created] == [second.start_time, first.start_time]
+        with pytest.raises(ValueError, match="Time conflict"):
+            booking_service.create_booking(first)
+
+    def test_naive_and_aware_times_conflict(self, sample_booking_data):
+        """Test that a naive booking time is read in the configured timezone."""
+        aware_start = sample_booking_data["start_time"]
+        naive = dict(sample_booking_data, start_time=aware_start.replace(tzinfo=None))
+        booking_service.create_booking(BookingCreate(**naive), system_init=True)
+
+        with pytest.raises(ValueError, match="Time conflict"):
+            booking_service.create_booking(BookingCreate(**sample_booking_data))
+
     def test_invalid_profession(self, sample_booking_data):
         """Test that invalid professions are rejected."""
         sample_booking_data["profession"] = "InvalidProfession"
@@ -96,12 +128,76 @@ class TestBookingRetrieval:
         assert isinstance(bookings[0], BookingResponse)
         assert bookings[0].id == create_sample_booking.id
 
+    def test_store_version_tracks_writes(self, create_sample_booking):
+        """Test that the store version moves on writes only."""
+        version = booking_service.store_version()
+        booking_service.get_all_bookings()
+        assert booking_service.store_version() == version
+        booking_service.cancel_booking(create_sample_booking.id)
+        assert booking_service.store_version() != version
+
+    def test_get_all_bookings_paginated(self, sample_booking_data):
+        """Test retrieving bookings one page at a time, in creation order."""
+        created = []
+        for hours in range(0, 6, 2):
+            sample_booking_data["start_time"] += timedelta(hours=hours)
+            created.append(booking_service.create_booking(BookingCreate(**sample_booking_data)))
+
+        page = booking_service.get_all_bookings(offset=1, limit=1)
+        assert [b.id for b in page] == [created[1].id]
+        assert len(booking_service.get_all_bookings(offset=1)) == 2
+        assert booking_service.get_all_bookings(offset=5, limit=10) == []
+
+    def test_get_all_bookings_rebuilt_after_write(self, sample_booking_data, create_sample_booking):
+        """Test that the cached listing is reused until the store changes."""
+        first = booking_service.get_all_bookings()
+        assert booking_service.get_all_bookings()[0] is first[0]
+
+        sample_booking_data["start_time"] += timedelta(hours=2)
+        booking_service.create_booking(BookingCreate(**sample_booking_data))
+        assert len(booking_service.get_all_bookings()) == 2
+
+    def test_iter_and_count_bookings(self, create_sample_booking):
+        """Test iterating over stored bookings without building responses."""
+        assert booking_service.count_bookings() == 1
+        bookings = list(booking_service.iter_bookings())
+        assert len(bookings) == 1
+        assert isinstance(bookings[0], Booking)
+        assert bookings[0].id == create_sample_booking.id
+
+    def test_iteration_survives_concurrent_writes(self, sample_booking_data, create_sample_booking):
+        """Test that a listing in progress iterates a snapshot, not the live store."""
+        bookings = booking_service.iter_bookings()
+        sample_booking_data["start_time"] += timedelta(hours=2)
+        booking_service.create_booking(BookingCreate(**sample_booking_data))
+
+        assert [b.id for b in bookings] == [create_sample_booking.id]
+        assert booking_service.count_bookings() == 2
+        assert len(list(booking_service.iter_bookings())) == 2
+
     def test_get_booking_by_id_exists(self, create_sample_booking):
         """Test retrieving an existing booking by ID."""
         booking = booking_service.get_booking_by_id(create_sample_booking.id)
         assert booking is not None
         assert booking.id == create_sample_booking.id
 
+    def test_get_booking_by_id_accepts_uuid(self, create_sample_booking):
+        """Test retrieving a booking with an already-parsed UUID."""
+        booking = booking_service.get_booking_by_id(UUID(create_sample_booking.id))
+        assert booking is not None
+        assert booking.id == create_sample_booking.id
+
+    def test_get_booking_by_id_served_from_create(self, create_sample_booking):
+        """Test that retrieval reuses the response built at creation time."""
+        assert booking_service.get_booking_by_id(create_sample_booking.id) is create_sample_booking
+
+    def test_get_booking_by_id_ignores_cleared_store(self, create_sample_booking):
+        """Test that a cached response is not served once the store is cleared."""
+        assert booking_service.get_booking_by_id(create_sample_booking.id) is not None
+        booking_service.clear_bookings()
+        assert booking_service.get_booking_by_id(create_sample_booking.id) is None
+        assert booking_service.get_all_bookings() == []
+
     def test_get_booking_by_id_not_exists(self):
         """Test retrieving a non-existent booking."""
         booking = booking_service.get_booking_by_id("non-existent-id")
@@ -175,6 +271,17 @@ def test_system_init_bypass_validation(sample_booking_data):
     response = booking_service.create_booking(booking_create, system_init=True)
     assert isinstance(response, BookingResponse)
 
+def test_seed_bookings_are_indexed(sample_booking_data):
+    """Test that seeded bookings are stored and take part in conflict checks."""
+    sample_booking_data["start_time"] -= timedelta(days=2)
+    booking_service.seed_bookings([BookingCreate(**sample_booking_data)])
+
+    assert booking_service.count_bookings() == 1
+    assert booking_service.is_overlapping(
+        sample_booking_data["technician_name"],
+        sample_booking_data["start_time"]
+    )
+
 def test_booking_end_time_calculation(sample_booking_data):
     """Test that end_time is correctly calculated as start_time + 1 hour."""
     booking_create = BookingCreate(**sample_booking_data)
@@ -0,0 +1,138 @@
+# tests/unit/test_bookings_router.py
+
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+from zoneinfo import ZoneInfo
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.routers import bookings
+from app.services import booking_service
+from app.config.settings import settings
+
+BASE_URL = "/api/v1/bookings"
+
+@pytest.fixture(autouse=True)
+def clear_bookings():
+    """Clear the in-memory booking database before and after each test."""
+    booking_service.clear_bookings()
+    yield
+    booking_service.clear_bookings()
+
+@pytest.fixture
+def client():
+    """Test client without the lifespan, so no seed data or NLP models are loaded."""
+    return TestClient(app)
+
+@pytest.fixture
+def booking_payload():
+    """JSON body for a valid booking tomorrow."""
+    start_time = datetime.now(ZoneInfo(settings.TIMEZONE)) + timedelta(days=1)
+    return {
+        "customer_name": "John Doe",
+        "technician_name": "Bob Smith",
+        "profession": "Plumber",
+        "start_time": start_time.isoformat()
+    }
+
+def test_create_and_retrieve_envelope(client, booking_payload):
+    """Test that success responses use the APIResponse envelope."""
+    created = client.post(f"{BASE_URL}/", json=booking_payload)
+    assert created.status_code == 201
+    body = created.json()
+    assert list(body) == ["success", "data", "error", "metadata"]
+    assert body["success"] is True
+    assert body["error"] is None
+    assert body["metadata"]["booking_duration"] == "1 hour"
+
+    booking = body["data"]
+    retrieved = client.get(f"{BASE_URL}/{booking['id']}")
+    assert retrieved.status_code == 200
+    assert retrieved.json()["data"] == booking
+    assert datetime.fromisoformat(booking["end_time"]) - datetime.fromisoformat(booking["start_time"]) == timedelta(hours=1)
+
+def test_unknown_booking_returns_404(client):
+    """Test that a well-formed but unknown ID gets the error envelope."""
+    response = client.get(f"{BASE_URL}/{uuid4()}")
+    assert response.status_code == 404
+    body = response.json()
+    assert body["success"] is False
+    assert body["data"] is None
+    assert body["error"]["code"] == "BOOKING_NOT_FOUND"
+
+@pytest.mark.parametrize("method", ["get", "delete"])
+def test_malformed_uuid_returns_422(client, method):
+    """Test that booking IDs are validated as UUIDs before reaching the service."""
+    response = getattr(client, method)(f"{BASE_URL}/not-a-uuid")
+    assert response.status_code == 422
+    assert response.json()["error"]["code"] == "VALIDATION_ERROR"
+
+@pytest.mark.parametrize("query", ["limit=0", "limit=101", "offset=-1"])
+def test_pagination_bounds(client, query):
+    """Test that out-of-range pagination parameters are rejected."""
+    assert client.get(f"{BASE_URL}/?{query}").status_code == 422
+
+def test_pagination_pages(client, booking_payload):
+    """Test that listing pages report totals and slice in creation order."""
+    for _ in range(3):
+        assert client.post(f"{BASE_URL}/", json=booking_payload).status_code == 201
+        start_time = datetime.fromisoformat(booking_payload["start_time"]) + timedelta(hours=2)
+        booking_payload["start_time"] = start_time.isoformat()
+
+    page = client.get(f"{BASE_URL}/?offset=1&limit=1").json()
+    assert page["metadata"]["total_count"] == 3
+    assert (page["metadata"]["offset"], page["metadata"]["limit"]) == (1, 1)
+    assert page["data"]["formatted_bookings"].count("**ID:**") == 1
+
+    past_end = client.get(f"{BASE_URL}/?offset=3").json()
+    assert past_end["data"] == {"formatted_bookings": ""}
+
+def test_batch_creation(client, booking_payload):
+    """Test that the batch endpoint books every row and reports the count."""
+    later = dict(booking_payload, start_time=(datetime.fromisoformat(booking_payload["start_time"]) + timedelta(hours=1)).isoformat())
+    response = client.post(f"{BASE_URL}/batch", json=[booking_payload, later])
+    assert response.status_code == 201
+    data = response.json()["data"]
+    assert data["created_count"] == 2
+    assert [b["start_time"] for b in data["bookings"]] == [booking_payload["start_time"], later["start_time"]]
+    assert booking_service.count_bookings() == 2
+
+def test_batch_conflict_creates_nothing(client, booking_payload):
+    """Test that a conflicting batch is rejected as a whole."""
+    response = client.post(f"{BASE_URL}/batch", json=[booking_payload, booking_payload])
+    assert response.status_code == 400
+    body = response.json()
+    assert body["error"]["message"].startswith("Booking #2: Time conflict")
+    assert body["error"]["details"] == {"batch_size": 2}
+    assert booking_service.count_bookings() == 0
+
+def test_command_batch_runs_in_order(client, nlp, monkeypatch):
+    """Test that batched commands are answered in order and see earlier bookings."""
+    monkeypatch.setattr(bookings, "get_nlp_service", lambda: nlp)
+    response = client.post(f"{BASE_URL}/commands/batch", json=[
+        {"message": "I want to book a plumber Bob Smith tomorrow at 10am"},
+        {"message": "List all bookings"},
+    ])
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["processed_count"] == 2
+    created, listed = data["results"]
+    assert created["intent"] == "create_booking"
+    assert created["message"].startswith("Booking confirmed")
+    assert listed["intent"] == "list_bookings"
+    assert "Technician: Bob Smith" in listed["message"]
+
+def test_command_batch_reports_failed_classification(client, nlp, monkeypatch):
+    """Test that a command whose classification failed is reported as unknown."""
+    def failing_classifier(*args, **kwargs):
+        raise RuntimeError("model unavailable")
+
+    nlp._intent_classifier = failing_classifier
+    monkeypatch.setattr(bookings, "get_nlp_service", lambda: nlp)
+    response = client.post(f"{BASE_URL}/commands/batch", json=[{"message": "Hello Bob Smith"}])
+    assert response.status_code == 200
+    result = response.json()["data"]["results"][0]
+    assert result["intent"] == "unknown"
+    assert set(result["intent_scores"].values()) == {0.0}
@@ -0,0 +1,73 @@
+# tests/unit/test_datetime_utils.py
+
+import pytest
+from datetime import datetime, timedelta
+
+from app.config.settings import settings
+from app.utils import datetime_utils
+from app.utils.datetime_utils import DateTimeExtractor
+
+@pytest.fixture
+def extractor():
+    return DateTimeExtractor()
+
+@pytest.fixture
+def now(extractor):
+    """A fixed reference time: Wednesday, 10:00 in the configured timezone."""
+    return datetime(2025, 1, 15, 10, 0, tzinfo=extractor.timezone_obj)
+
+def extract(extractor, text, now):
+    return extractor.extract_datetime_entities({}, text, now)["start_time"]
+
+@pytest.mark.parametrize("text", [
+    "Book a plumber for Friday",
+    "I need an electrician tomorrow",
+    "Schedule it for the day after tomorrow",
+    "Can someone come at 3pm?",
+    "Book me in on March 3",
+    "Appointment on 2025-02-01 please",
+])
+def test_has_datetime_hint(extractor, text):
+    """Test that messages naming a date or time are not skipped."""
+    assert extractor.has_datetime_hint(text)
+
+@pytest.mark.parametrize("text", [
+    "Book Bob Smith the plumber",
+    "It is sunny and I need a welder",
+    "Cancel my booking please",
+])
+def test_no_datetime_hint(extractor, text):
+    """Test that messages without date words or digits are skipped."""
+    assert not extractor.has_datetime_hint(text)
+
+@pytest.mark.parametrize("weekday, days_ahead", [(3, 1), (4, 2), (0, 5), (2, 7)])
+def test_next_weekday(extractor, now, weekday, days_ahead):
+    """Test that the next occurrence is 1-7 days ahead, a week for today's weekday."""
+    assert extractor._next_weekday(now, weekday) == now + timedelta(days=days_ahead)
+
+@pytest.mark.parametrize("text, expected", [
+    ("Book a plumber for friday at 3pm", datetime(2025, 1, 17, 15, 0)),
+    ("Book a plumber for Thurs at 10:30 am", datetime(2025, 1, 16, 10, 30)),
+    ("Need a painter tomorrow at 11am", datetime(2025, 1, 16, 11, 0)),
+    ("Need a painter the day after tomorrow", datetime(2025, 1, 17, settings.DEFAULT_BOOKING_HOUR, 0)),
+    ("Can someone come at 2 pm", datetime(2025, 1, 15, 14, 0)),
+])
+def test_extract_datetime(extractor, now, text, expected):
+    """Test weekday, relative-day and clock-time messages against a fixed now."""
+    assert extract(extractor, text, now) == expected.replace(tzinfo=extractor.timezone_obj)
+
+def test_extract_without_hint_uses_default_time(extractor, now):
+    """Test that a message with no date falls back to tomorrow at the default hour."""
+    expected = datetime(2025, 1, 16, settings.DEFAULT_BOOKING_HOUR, 0, tzinfo=extractor.timezone_obj)
+    assert extract(extractor, "It is sunny, send a welder", now) == expected
+
+def test_timestamps_rebuilt_once_per_second(monkeypatch):
+    """Test that the metadata timestamps are reused within a second and refreshed after."""
+    monkeypatch.setattr(datetime_utils, "epoch_seconds", lambda: 1736935200.25)
+    assert datetime_utils.current_utc_timestamp() == "2025-01-15T10:00:00Z"
+    first = datetime_utils.current_iso_timestamp()
+    assert datetime_utils.current_iso_timestamp() is first
+
+    monkeypatch.setattr(datetime_utils, "epoch_seconds", lambda: 1736935201.0)
+    assert datetime_utils.current_utc_timestamp() == "2025-01-15T10:00:01Z"
+    assert datetime_utils.current_iso_timestamp() != first
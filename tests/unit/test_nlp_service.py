@@ -0,0 +1,72 @@
+# tests/unit/test_nlp_service.py
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.config.settings import settings
+from app.services import booking_service, nlp_service
+from app.services.nlp_service import get_nlp_service
+
+
+@pytest.fixture(autouse=True)
+def clear_bookings():
+    """Clear the in-memory booking database before and after each test."""
+    booking_service.clear_bookings()
+    yield
+    booking_service.clear_bookings()
+
+
+def test_rule_match_skips_zero_shot(nlp, zero_shot):
+    """Test that a clear pattern match never reaches the zero-shot model."""
+    intent, scores = nlp.classify_intent("Please list all bookings")
+    assert intent == "list_bookings"
+    assert scores["list_bookings"] == 1.0
+    assert zero_shot.inputs == []
+
+
+def test_zero_shot_sees_original_text(nlp, zero_shot):
+    """Test that caching by normalized text still feeds the model the message as written."""
+    intent, _ = nlp.classify_intent("  Hello Bob Smith  ")
+    assert intent == "create_booking"
+    assert zero_shot.inputs == ["  Hello Bob Smith  "]
+
+    # Same message up to case and whitespace: served from the cache
+    assert nlp.classify_intent("hello bob smith")[0] == intent
+    assert len(zero_shot.inputs) == 1
+
+
+def test_decision_counters_skip_cache_hits(nlp):
+    """Test that rule/zero-shot counters count uncached classifications only."""
+    nlp.classify_intent("List all bookings")
+    nlp.classify_intent("list all bookings ")
+    nlp.classify_intent("Hello Bob Smith")
+    assert (nlp._rule_hits, nlp._zero_shot_fallbacks) == (1, 1)
+
+
+def test_intent_classifier_preload(nlp, zero_shot, monkeypatch):
+    """Test that the zero-shot model loads at startup only when preloading is requested."""
+    assert nlp._intent_classifier is None
+    monkeypatch.setattr(settings, "PRELOAD_INTENT_CLASSIFIER", True)
+    assert type(nlp)()._intent_classifier is zero_shot
+
+
+def test_get_nlp_service_builds_once(monkeypatch):
+    """Test that concurrent first calls share a single NLPService."""
+    built = []
+    gate = threading.Event()
+
+    class SlowService:
+        def __init__(self):
+            gate.wait(timeout=1)
+            built.append(self)
+
+    monkeypatch.setattr(nlp_service, "NLPService", SlowService)
+    monkeypatch.setattr(nlp_service, "_nlp_service", None)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(get_nlp_service) for _ in range(4)]
+        gate.set()
+        services = [future.result(timeout=5) for future in futures]
+    assert len(built) == 1
+    assert all(service is built[0] for service in services)